@@ -4,14 +4,17 @@ from pathlib import Path
 from unittest.mock import patch, MagicMock
 import sys
 
-# Mock the Streamlit imports
-sys.modules['streamlit'] = MagicMock()
-sys.modules['PIL'] = MagicMock()
-sys.modules['PIL.Image'] = MagicMock()
-sys.modules['requests'] = MagicMock()
+# Mock the Streamlit imports; scoped so other test modules keep the real packages
+_MOCKED = {
+    'streamlit': MagicMock(),
+    'PIL': MagicMock(),
+    'PIL.Image': MagicMock(),
+    'requests': MagicMock(),
+}
 
 # Import the component after mocking
-from ui_components.RecommendationCard import RecommendationCard
+with patch.dict(sys.modules, _MOCKED):
+    from ui_components.RecommendationCard import RecommendationCard
 
 class TestUIRecommender(unittest.TestCase):
     @classmethod
@@ -22,6 +25,11 @@ class TestUIRecommender(unittest.TestCase):
             cls.test_data = json.load(f)
     
     def setUp(self):
+        # patch('streamlit.X') below resolves against the mocked module
+        streamlit_mock = patch.dict(sys.modules, {'streamlit': _MOCKED['streamlit']})
+        streamlit_mock.start()
+        self.addCleanup(streamlit_mock.stop)
+
         # Create a complete mock recommendation
         self.sample_rec = {
             'id': 550,
@@ -1,66 +1,204 @@
+import re
 import pytest
-import logging
+from types import SimpleNamespace
 from unittest.mock import patch
-from app_ui.components.MovieTile import MovieTile
 
-# Setup logger
-logger = logging.getLogger(__name__)
-logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+import app_ui.components.MovieTile as movie_tile
+from app_ui.components.MovieTile import (
+    MovieTile,
+    MovieTileGrid,
+    _esc,
+    _prepare_tile,
+    _render_tile_html,
+    _resolve_poster,
+    _tile_key,
+    _FALLBACK_DATAURI,
+)
+
+
+@pytest.fixture
+def sample_movie():
+    return {
+        "id": 550,
+        "title": "Fight Club",
+        "poster_path": "/pB8BM7pdSp6B6Ih7QZ4DrQ3PmJK.jpg",
+        "release_date": "1999-10-15",
+        "vote_average": 8.4,
+        "runtime": 139,
+        "genres": [{"name": "Drama"}, {"name": "Thriller"}],
+        "overview": "An insomniac office worker...",
+    }
+
+
+@pytest.fixture(autouse=True)
+def session_state():
+    with patch.object(movie_tile.st, "session_state", {}) as state:
+        yield state
+
+
+@pytest.fixture
+def mock_html():
+    with patch.object(movie_tile.components, "html") as html:
+        yield html
+
+
+def _render(movie, suffix=None, **kwargs):
+    fields, tile_key, tile_state = _prepare_tile(movie, suffix, **kwargs)
+    return _render_tile_html(fields, tile_key, tile_state, lazy_load=True, is_dark=False)
+
+
+class TestResolvePoster:
+    def test_tmdb_path_gets_base_url(self):
+        assert _resolve_poster("/abc.jpg") == "https://image.tmdb.org/t/p/w500/abc.jpg"
+
+    def test_full_url_is_kept(self):
+        assert _resolve_poster("https://example.com/p.jpg") == "https://example.com/p.jpg"
+
+    @pytest.mark.parametrize("path", ["", None])
+    def test_missing_path_uses_inline_fallback(self, path):
+        assert _resolve_poster(path) == _FALLBACK_DATAURI
+        assert _FALLBACK_DATAURI.startswith("data:")
+
+
+class TestEscaping:
+    def test_esc_escapes_markup_and_quotes(self):
+        assert _esc("<b>\"Tom\" & 'Jerry'</b>") == (
+            "&lt;b&gt;&quot;Tom&quot; &amp; &#x27;Jerry&#x27;&lt;/b&gt;"
+        )
+
+    def test_title_is_escaped_in_markup(self):
+        html = _render({"id": 1, "title": "<script>alert(1)</script>"})
+        assert "<script>alert(1)</script>" not in html
+        assert "&lt;script&gt;alert(1)&lt;/script&gt;" in html
+
+
+class TestTileKey:
+    def test_key_is_stable(self):
+        assert _tile_key("550", "grid_0") == _tile_key("550", "grid_0")
+        # Computed from a fresh cache, as in another process
+        assert _tile_key.__wrapped__("550", "grid_0") == _tile_key("550", "grid_0")
+
+    def test_key_depends_on_identity_and_suffix(self):
+        assert _tile_key("550", None) != _tile_key("551", None)
+        assert _tile_key("550", "a") != _tile_key("550", "b")
+
+    def test_key_uses_movie_id_over_title(self, sample_movie):
+        _, first, _ = _prepare_tile(sample_movie, None)
+        _, second, _ = _prepare_tile(dict(sample_movie, title="Renamed"), None)
+        assert first == second
+
+
+class TestTileMarkup:
+    def test_fields_render(self, sample_movie):
+        html = _render(sample_movie)
+        assert 'data-movie-id="550"' in html
+        assert "Fight Club" in html
+        assert "1999" in html
+        assert "8.4" in html
+        assert "2h 19m" in html
+        assert "Drama" in html and "Thriller" in html
+
+    def test_missing_poster_uses_fallback(self):
+        html = _render({"id": 2, "title": "No Poster", "poster_path": None})
+        assert f'src="{_esc(_FALLBACK_DATAURI)}"' in html
+        assert "srcset=" not in html
+
+    def test_unhashable_runtime_does_not_break_rendering(self):
+        html = _render({"id": 3, "title": "t2", "runtime": {"a": 1}})
+        assert "⏱ N/A" in html
+
+    def test_object_movie_data(self, sample_movie):
+        assert "Fight Club" in _render(SimpleNamespace(**sample_movie))
+
+    def test_empty_movie_is_skipped(self):
+        assert _prepare_tile({}, None) is None
+
+    def test_tldr_from_map(self, sample_movie):
+        html = _render(sample_movie, tldr_map={550: {"summary": "Soap & <chaos>", "themes": ["identity"]}})
+        assert "Soap &amp; &lt;chaos&gt;" in html
+        assert "identity" in html
+
+    def test_tldr_none_values(self, sample_movie):
+        html = _render(dict(sample_movie, tldr={"summary": None, "themes": None, "flags": None}))
+        assert "Fight Club" in html
+        html = _render(sample_movie, tldr_map={550: {"themes": None, "flags": None}})
+        assert "Fight Club" in html
+
+
+class TestMovieTileGrid:
+    def test_single_component_for_grid(self, mock_html, sample_movie):
+        movies = [dict(sample_movie, id=i) for i in range(4)]
+        MovieTileGrid(movies, ncols=2, is_dark=False)
+
+        mock_html.assert_called_once()
+        html = mock_html.call_args.args[0]
+        assert html.count('class="movie-tile"') == 4
+        assert "grid-template-columns: repeat(2, 1fr)" in html
+
+    def test_loading_and_priority_by_position(self, mock_html, sample_movie):
+        movies = [dict(sample_movie, id=i) for i in range(8)]
+        MovieTileGrid(movies, ncols=4, is_dark=False, above_fold=6)
+
+        html = mock_html.call_args.args[0]
+        attrs = re.findall(r'loading="(\w+)"[^>]*fetchpriority="(\w+)"', html)
+        assert attrs == [("eager", "high")] * 6 + [("lazy", "low")] * 2
+
+    def test_preloads_above_fold_posters_ahead_of_tiles(self, mock_html, sample_movie):
+        movies = [dict(sample_movie, id=i, poster_path=f"/p{i}.jpg") for i in range(8)]
+        movies[1]["poster_path"] = None
+        MovieTileGrid(movies, ncols=3, is_dark=False, above_fold=6)
+
+        html = mock_html.call_args.args[0]
+        preloads = re.findall(r'<link rel="preload"[^>]*>', html)
+        # Five real posters above the fold; the inline fallback is not fetched
+        assert len(preloads) == 5
+        assert html.index(preloads[-1]) < html.index('<div class="mt-grid"')
+        assert 'imagesizes="calc((100vw - 32px) / 3)"' in preloads[0]
+
+    def test_sizes_follow_column_count(self, mock_html, sample_movie):
+        MovieTileGrid([sample_movie], ncols=4, is_dark=False)
+        assert 'sizes="calc((100vw - 48px) / 4)"' in mock_html.call_args.args[0]
+
+    def test_height_includes_gaps(self, mock_html, sample_movie):
+        movies = [dict(sample_movie, id=i) for i in range(6)]
+        MovieTileGrid(movies, ncols=3, is_dark=False, row_height=500)
+        # Two rows plus the 16px gap between them
+        assert mock_html.call_args.kwargs["height"] == 2 * 500 + 16
+
+    def test_height_grows_with_column_width(self, mock_html, sample_movie):
+        MovieTileGrid([sample_movie], ncols=2, is_dark=False, frame_width=1200)
+        wide = mock_html.call_args.kwargs["height"]
+        MovieTileGrid([sample_movie], ncols=4, is_dark=False, frame_width=1200)
+        assert wide > mock_html.call_args.kwargs["height"]
+
+    def test_unhashable_runtime(self, mock_html):
+        MovieTileGrid([{"title": "t2", "runtime": {"a": 1}}], is_dark=False)
+        mock_html.assert_called_once()
+
+    def test_no_movies_renders_nothing(self, mock_html):
+        MovieTileGrid([None, {}], is_dark=False)
+        mock_html.assert_not_called()
 
 
 class TestMovieTile:
-    @pytest.fixture
-    def sample_movie(self):
-        return {
-            "poster_path": "valid_path.jpg",
-            "title": "Test Movie",
-            "release_year": "2023"
-        }
-
-    @patch("streamlit.markdown")
-    def test_hover_animations(self, mock_markdown, sample_movie):
-        logger.info("🎬 Testing hover animations")
-        MovieTile(sample_movie)
-
-        css_blocks = [call.args[0] for call in mock_markdown.call_args_list]
-        for css in css_blocks:
-            logger.info(f"🔍 CSS block:\n{css}")
-
-        assert any("transition: transform 0.2s" in css for css in css_blocks)
-        assert any(".movie-tile:hover" in css for css in css_blocks)
-        assert any("transform: scale(1.05)" in css for css in css_blocks)
-        logger.info("✅ Hover animation CSS validated")
-
-    @patch("streamlit.image")
-    def test_fallback_image_handling(self, mock_image):
-        logger.info("🧪 Testing fallback image logic")
-        MovieTile({"title": "No Poster Movie", "poster_path": None})
-        image_paths = [call.args[0] for call in mock_image.call_args_list]
-        for path in image_paths:
-            logger.info(f"📷 Image used: {path}")
-        assert any("image-fallback.svg" in path for path in image_paths)
-        logger.info("✅ Fallback image used correctly")
-
-    @patch("streamlit.markdown")
-    def test_loading_states(self, mock_markdown):
-        logger.info("⌛ Testing loading state rendering")
-        MovieTile({"title": "Loading..."})
-        calls = [str(call.args) for call in mock_markdown.call_args_list]
-        for c in calls:
-            logger.info(f"🆔 markdown call args: {c}")
-        assert any("movie-tile" in c for c in calls)
-        logger.info("✅ Loading state rendering confirmed")
-
-    @patch("streamlit.markdown")
-    @patch("streamlit.write")
-    def test_testid_generation(self, mock_write, mock_markdown, sample_movie):
-        logger.info("🔎 Testing testid suffix generation")
-        MovieTile(sample_movie, testid_suffix="123")
-
-        all_calls = [str(call.args) for call in mock_write.call_args_list + mock_markdown.call_args_list]
-        for c in all_calls:
-            logger.info(f"🆔 Rendered call args: {c}")
-
-        assert any("movie-tile-123" in c for c in all_calls)
-        assert any("movie-title-123" in c for c in all_calls)
-        logger.info("✅ Test ID suffixes validated")
+    def test_renders_one_component(self, mock_html, sample_movie):
+        MovieTile(sample_movie, testid_suffix="123", is_dark=False)
+
+        mock_html.assert_called_once()
+        html = mock_html.call_args.args[0]
+        assert ".movie-tile:hover" in html
+        assert _tile_key("550", "123") in html
+
+    def test_details_link_opens_new_tab(self, mock_html, sample_movie):
+        MovieTile(sample_movie, is_dark=False)
+        html = mock_html.call_args.args[0]
+        assert 'href="/page_03_movie_details?id=550" target="_blank"' in html
+
+
+class TestShowMovieToast:
+    def test_duration_is_passed_in_seconds(self):
+        with patch.object(movie_tile.st, "toast") as toast:
+            movie_tile.show_movie_toast("like", "Fight Club", duration=3000)
+            movie_tile.show_movie_toast("like", "Fight Club", duration=200)
+
+        assert [call.kwargs["duration"] for call in toast.call_args_list] == [3, 1]
@@ -0,0 +1,81 @@
+# app_tests/unit/ui_components/test_navigation.py
+import pytest
+from unittest.mock import patch, MagicMock
+
+import ui_components.Navigation as navigation
+
+
+class _SessionState(dict):
+    """Dict with attribute access, like st.session_state."""
+    __getattr__ = dict.__getitem__
+    __setattr__ = dict.__setitem__
+
+
+@pytest.fixture
+def nav_st():
+    with patch.object(navigation, "st") as st:
+        st.session_state = _SessionState(current_page="home")
+        st.query_params = {}
+        yield st
+
+
+@pytest.fixture
+def client():
+    with patch.object(navigation, "analytics_client") as client:
+        yield client
+
+
+class TestNavigateToMovieDetails:
+    def test_success_logs_one_batch(self, nav_st, client):
+        navigation.navigate_to_movie_details(550, "Fight Club", source="poster_click")
+
+        client.log_events.assert_called_once()
+        events = client.log_events.call_args.args[0]
+        assert [e["event_type"] for e in events] == ["navigation_attempt", "navigation"]
+        assert all(e["movie_id"] == 550 and e["source_page"] == "home" for e in events)
+        assert nav_st.query_params == {"movie_id": 550}
+        nav_st.rerun.assert_called_once()
+
+    def test_failure_logs_error_in_same_batch(self, nav_st, client):
+        nav_st.query_params = MagicMock()
+        nav_st.query_params.update.side_effect = RuntimeError("boom")
+        with patch.object(navigation, "fallback_navigation") as fallback:
+            navigation.navigate_to_movie_details(550, "Fight Club")
+
+        client.log_events.assert_called_once()
+        events = client.log_events.call_args.args[0]
+        assert [e["event_type"] for e in events] == ["navigation_attempt", "navigation_error"]
+        assert events[-1]["error"] == "boom"
+        fallback.assert_called_once_with(550, "Fight Club")
+
+    def test_events_share_one_timestamp(self, nav_st, client):
+        navigation.navigate_to_movie_details(550, "Fight Club")
+
+        events = client.log_events.call_args.args[0]
+        assert len({e["timestamp"] for e in events}) == 1
+
+
+class TestPageQueryParam:
+    def test_back_button_sets_page_param(self, nav_st, client):
+        nav_st.button.return_value = True
+
+        navigation.back_button("Home", use_session_state=False)
+
+        assert nav_st.query_params == {"page": "Home"}
+        nav_st.rerun.assert_called_once()
+
+    def test_navigate_to_page_sets_page_param(self, nav_st, client):
+        nav_st.button.return_value = True
+
+        navigation.navigate_to_page("Search", use_session_state=False)
+
+        assert nav_st.query_params == {"page": "Search"}
+        nav_st.rerun.assert_called_once()
+
+    def test_session_state_navigation_leaves_query_params(self, nav_st, client):
+        nav_st.button.return_value = True
+
+        navigation.back_button("Home")
+
+        assert nav_st.session_state["current_page"] == "Home"
+        assert nav_st.query_params == {}
@@ -0,0 +1,75 @@
+# app_tests/unit/ui_components/test_quick_summary.py
+import pytest
+from unittest.mock import patch
+
+import ui_components.QuickSummary as quick_summary
+
+
+@pytest.fixture
+def qs_st():
+    with patch.object(quick_summary, "st") as st, \
+            patch.object(quick_summary, "_inject_quick_summary_css"):
+        yield st
+
+
+def _card_html(st):
+    st.markdown.assert_called_once()
+    return st.markdown.call_args.args[0]
+
+
+class TestRenderQuickSummary:
+    def test_card_is_one_markdown_element(self, qs_st):
+        quick_summary.render_quick_summary({
+            "summary": "A heist gone wrong",
+            "themes": ["Loyalty", "Betrayal"],
+            "content_flags": ["Violence"],
+        })
+
+        html = _card_html(qs_st)
+        assert "A heist gone wrong" in html
+        assert html.count('class="theme-pill"') == 2
+        assert html.count('class="content-flag"') == 1
+
+    def test_summary_is_escaped(self, qs_st):
+        quick_summary.render_quick_summary({"summary": "<img src=x onerror=alert(1)> & more"})
+
+        html = _card_html(qs_st)
+        assert "<img" not in html
+        assert "&lt;img src=x onerror=alert(1)&gt; &amp; more" in html
+
+    def test_long_summary_is_truncated(self, qs_st):
+        quick_summary.render_quick_summary({"summary": "x" * 500})
+
+        html = _card_html(qs_st)
+        assert "x" * (quick_summary._SUMMARY_MAX - 1) + "…" in html
+        assert "x" * quick_summary._SUMMARY_MAX not in html
+
+    def test_themes_and_flags_are_escaped(self, qs_st):
+        quick_summary.render_quick_summary({
+            "summary": "ok",
+            "themes": ['"); alert(1); ("', "<b>bold</b>"],
+            "content_flags": ["<script>x</script>"],
+        })
+
+        html = _card_html(qs_st)
+        assert "<b>bold</b>" not in html and "<script>x" not in html
+        assert 'data-theme="&quot;); alert(1); (&quot;"' in html
+        assert "&lt;script&gt;x&lt;/script&gt;" in html
+
+    def test_non_string_items_are_stringified(self, qs_st):
+        quick_summary.render_quick_summary({
+            "summary": "ok",
+            "themes": [["a", "b"], None, 7],
+            "content_flags": [{"k": "<v>"}],
+        })
+
+        html = _card_html(qs_st)
+        assert html.count('class="theme-pill"') == 3
+        assert "{&#x27;k&#x27;: &#x27;&lt;v&gt;&#x27;}" in html
+
+    def test_legacy_flags_key(self, qs_st):
+        data = {"summary": "ok", "flags": ["Gore"]}
+        quick_summary.render_quick_summary_with_flags(data)
+
+        assert '<span class="content-flag">Gore</span>' in _card_html(qs_st)
+        assert "content_flags" not in data
@@ -0,0 +1,103 @@
+# app_tests/unit/ui_components/test_recommendation_card.py
+import sys
+import pytest
+from unittest.mock import patch, MagicMock
+
+# The TMDB client connects and the hybrid model builds a recommender on import;
+# the card only needs the poster URL helper and the MovieRecommendation type
+_MOCKED = {
+    "service_clients.tmdb_client": MagicMock(),
+    "ai_smart_recommender.recommender_engine.strategy_interfaces.hybrid_model": MagicMock(),
+}
+
+with patch.dict(sys.modules, _MOCKED):
+    import ui_components.RecommendationCard as rec_card
+
+
+class _Recommendation(dict):
+    """Dict-backed movie that also exposes recommendation attributes."""
+    def __init__(self, match_type="genre", **fields):
+        super().__init__(fields)
+        self.match_type = match_type
+
+
+def _columns(spec, **kwargs):
+    return [MagicMock() for _ in range(spec if isinstance(spec, int) else len(spec))]
+
+
+@pytest.fixture
+def card_st():
+    with patch.object(rec_card, "st") as st, \
+            patch.object(rec_card, "log_performance"):
+        st.session_state = {}
+        st.columns.side_effect = _columns
+        st.button.return_value = False
+        yield st
+
+
+@pytest.fixture
+def movie():
+    return {
+        "id": 550,
+        "title": "Fight Club",
+        "poster_path": "/pB8BM7pdSp6B6Ih7QZ4DrQ3PmJK.jpg",
+        "vote_average": 8.4,
+        "release_date": "1999-10-15",
+        "genres": [{"name": "Drama"}, "Thriller", {"name": "Comedy"}],
+    }
+
+
+def _markdown_html(st):
+    return [call.args[0] for call in st.markdown.call_args_list]
+
+
+class TestRecommendationCard:
+    def test_tmdb_poster_is_lazy_img(self, card_st, movie):
+        with patch.object(rec_card, "_poster_url", return_value="https://image.tmdb.org/t/p/w154/p.jpg"):
+            rec_card.RecommendationCard(movie)
+
+        posters = [html for html in _markdown_html(card_st) if html.startswith("<img")]
+        assert len(posters) == 1
+        assert 'loading="lazy"' in posters[0] and 'decoding="async"' in posters[0]
+        card_st.image.assert_not_called()
+
+    def test_missing_poster_uses_bundled_fallback(self, card_st, movie):
+        rec_card.RecommendationCard(dict(movie, poster_path=None))
+
+        card_st.image.assert_called_once()
+        assert card_st.image.call_args.args[0] == rec_card.POSTER_FALLBACK_IMAGE
+
+    def test_first_two_genres_shown(self, card_st, movie):
+        with patch.object(rec_card, "_poster_url", return_value=None):
+            rec_card.RecommendationCard(movie)
+
+        captions = [call.args[0] for call in card_st.caption.call_args_list]
+        assert "🎭 Drama, Thriller" in captions
+
+    def test_card_emits_no_stylesheet(self, card_st, movie):
+        with patch.object(rec_card, "_poster_url", return_value=None):
+            rec_card.RecommendationCard(_Recommendation(**movie))
+            rec_card.RecommendationCard(_Recommendation(match_type="mood", **movie))
+
+        html = _markdown_html(card_st)
+        assert not any("<style>" in part for part in html)
+        badges = [part for part in html if 'class="rec-badge"' in part]
+        # Only the per-card colour is inline
+        assert [badge.count("--rec-color") for badge in badges] == [1, 1]
+        assert "#edc948" in badges[1]
+
+
+class TestInjectCardCss:
+    def test_one_stylesheet_per_call(self, card_st):
+        rec_card.inject_card_css()
+
+        card_st.markdown.assert_called_once()
+        html = card_st.markdown.call_args.args[0]
+        assert html.count("<style>") == 1
+        assert rec_card.CRITIC_STYLES["default"]["border"] in html
+
+    def test_follows_critic_mode(self, card_st):
+        card_st.session_state["critic_mode"] = "Arthouse_Snob"
+        rec_card.inject_card_css()
+
+        assert rec_card.CRITIC_STYLES["arthouse_snob"]["border"] in card_st.markdown.call_args.args[0]
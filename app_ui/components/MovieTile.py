@@ -1,20 +1,618 @@
 # ui_components/MovieTile.py
 import streamlit as st
 import streamlit.components.v1 as components
-from typing import Union, Optional, Literal
-import html
+from types import MappingProxyType
+from typing import Union, Optional, Literal, Mapping
+import base64
+import hashlib
 import json
-from datetime import datetime
+import math
+import os
+from functools import lru_cache
+from pathlib import Path
+from string import Template
+from core_config.constants import POSTER_FALLBACK_IMAGE
 from service_clients.analytics_client import analytics_client
 
-# Import navigation functions
-try:
-    from ui_components.Navigation import navigate_to_movie_details
-except ImportError:
-    # Fallback navigation function
-    def navigate_to_movie_details(movie_id, movie_title=""):
-        st.query_params.update({"movie_id": movie_id})
-        st.rerun()
+# Same replacements as html.escape(quote=True), done in a single pass
+_HTML_TRANS = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#x27;'})
+
+@lru_cache(maxsize=4096)
+def _esc(s: str) -> str:
+    """HTML-escape text (memoised - genre names and titles repeat across tiles and reruns)."""
+    return s.translate(_HTML_TRANS)
+
+def _format_runtime(mins: int) -> str:
+    """Format a runtime in minutes as '2h 05m' (or '45m' under an hour)."""
+    hours, mins = divmod(mins, 60)
+    return f"{hours}h {mins:02d}m" if hours else f"{mins}m"
+
+# Runtimes cluster well inside this range, so most tiles hit the lookup table
+_RUNTIME_STR = {m: _format_runtime(m) for m in range(1, 400)}
+
+# Missing/broken posters use the bundled SVG inlined as a data URI, so a
+# fallback-heavy grid makes no extra image requests
+FALLBACK_POSTER = Path(__file__).resolve().parents[2] / POSTER_FALLBACK_IMAGE
+_FALLBACK_DATAURI = "data:image/svg+xml;base64," + base64.b64encode(FALLBACK_POSTER.read_bytes()).decode()
+
+_TMDB_POSTER_BASE = "https://image.tmdb.org/t/p/w500"
+
+@lru_cache(maxsize=4096)
+def _resolve_poster(poster_path: str) -> str:
+    """Resolve a poster path to a displayable URL (TMDB CDN, absolute or placeholder)."""
+    if not poster_path:
+        return _FALLBACK_DATAURI
+    # TMDB paths always start with '/'; anything else is already a full URL
+    if poster_path[0] == '/':
+        return _TMDB_POSTER_BASE + poster_path
+    return poster_path
+
+# Poster widths offered to the browser for TMDB paths (it picks the smallest adequate one)
+_POSTER_SIZES = ("w185", "w342", "w500")
+
+# Grid geometry in px: the .mt-grid gap, and the block under each 2:3 poster
+# (title, meta line, up to two rows of genre tags, container margin)
+_GRID_GAP = 16
+_TILE_META_HEIGHT = 140
+
+@lru_cache(maxsize=4096)
+def _poster_srcset_attrs(poster_path: str, ncols: int = 1) -> str:
+    """
+    srcset/sizes attributes for a TMDB poster path, or '' for other sources.
+
+    sizes is one grid column of the tile's frame: the frame width split over
+    ``ncols`` columns after the 16px gaps between them.
+    """
+    if not poster_path or poster_path[0] != '/':
+        return ''
+    srcset = ", ".join(
+        f"https://image.tmdb.org/t/p/{size}{poster_path} {size[1:]}w" for size in _POSTER_SIZES
+    )
+    sizes = f"calc((100vw - {(ncols - 1) * _GRID_GAP}px) / {ncols})" if ncols > 1 else "100vw"
+    return f'srcset="{_esc(srcset)}" sizes="{sizes}"'
+
+def _preload_link(image_url: str, srcset_attrs: str = '') -> str:
+    """High-priority <link rel="preload"> for an escaped poster URL."""
+    # The preload carries the tile's srcset, so it fetches the size the <img> picks
+    srcset = srcset_attrs.replace('srcset=', 'imagesrcset=').replace('sizes=', 'imagesizes=')
+    return (
+        f'<link rel="preload" as="image" href="{image_url}"'
+        f'{" " + srcset if srcset else ""} fetchpriority="high">'
+    )
+
+# Tile diagnostics (st.error/st.warning per tile) are opt-in via MOVIETILE_DEBUG=1,
+# so debug=True left in a caller costs nothing in production
+_DEBUG_ENABLED = os.environ.get("MOVIETILE_DEBUG") == "1"
+
+# Movie details page route; it reads the movie from the ``id`` query param
+_DETAILS_PAGE = "page_03_movie_details"
+
+def _details_page_url() -> str:
+    """Absolute details page URL, honouring a configured ``server.baseUrlPath``."""
+    base = (st.get_option("server.baseUrlPath") or "").strip("/")
+    return f"/{base}/{_DETAILS_PAGE}" if base else f"/{_DETAILS_PAGE}"
+
+# Theme palettes, exposed to the stylesheet as --mp-* custom properties
+_PALETTE_LIGHT = MappingProxyType({
+    'text': '#111111',
+    'meta': '#666666',
+    'genre-bg': 'rgba(0,0,0,0.05)',
+    'genre-fg': '#555555',
+    'genre-border': '#eeeeee',
+})
+_PALETTE_DARK = MappingProxyType({
+    'text': '#ffffff',
+    'meta': '#aaaaaa',
+    'genre-bg': 'rgba(255,255,255,0.1)',
+    'genre-fg': '#cccccc',
+    'genre-border': '#444444',
+})
+# Palette lookup keyed by is_dark
+_THEME = MappingProxyType({False: _PALETTE_LIGHT, True: _PALETTE_DARK})
+
+def _palette_css(selector: str, palette: Mapping[str, str]) -> str:
+    """Render a palette as a block of --mp-* custom properties."""
+    props = "".join(f"\n    --mp-{name}: {value};" for name, value in palette.items())
+    return f"{selector} {{{props}\n}}\n"
+
+def _get_theme() -> str:
+    """
+    Streamlit's configured theme base, via the public st.get_option.
+
+    Not memoised: toggle_theme/apply_theme_settings flip theme.base at runtime.
+    """
+    return st.get_option("theme.base") or "light"
+
+# Tile stylesheet rules - shared class names and theme custom properties, so
+# the text is identical for every tile. The palette blocks are prepended by
+# _compiled_assets.
+_TILE_CSS_RULES = """\
+
+/* Batched grid layout (MovieTileGrid) */
+.mt-grid {
+    display: grid;
+    gap: 16px;
+}
+
+/* Container - Perfect spacing */
+.movie-tile-container {
+    width: 100%;
+    margin-bottom: 0.5rem !important;
+    position: relative;
+}
+
+/* Poster container with enhanced hover effects */
+.movie-tile {
+    position: relative;
+    width: 100%;
+    aspect-ratio: 2/3;
+    border-radius: 8px;
+    overflow: hidden;
+    cursor: pointer;
+    margin-bottom: 0 !important;
+    transition: all 0.3s ease;
+    box-shadow: 0 2px 8px rgba(0,0,0,0.1);
+    transform-origin: center;
+}
+
+/* Enhanced hover effects */
+.movie-tile:hover {
+    transform: scale(1.05);
+    box-shadow: 0 8px 25px rgba(0,0,0,0.15);
+    z-index: 10;
+}
+
+/* Poster link - a block so the image keeps filling the tile */
+.movie-tile-link {
+    display: block;
+    height: 100%;
+}
+
+/* Poster image with subtle hover effect */
+.movie-poster {
+    width: 100%;
+    height: 100%;
+    object-fit: cover;
+    display: block;
+    transition: all 0.3s ease;
+}
+
+.movie-tile:hover .movie-poster {
+    transform: scale(1.08);
+    filter: brightness(1.05);
+}
+
+/* Action buttons */
+.action-buttons {
+    position: absolute;
+    top: 50%;
+    left: 50%;
+    transform: translate(-50%, -50%);
+    display: flex;
+    gap: 16px;
+    z-index: 3;
+    opacity: 0;
+    transition: opacity 0.2s ease;
+    pointer-events: none;
+}
+
+.action-button {
+    pointer-events: auto;
+    background: rgba(255, 255, 255, 0.9);
+    border: none;
+    border-radius: 50%;
+    width: 42px;
+    height: 42px;
+    display: flex;
+    align-items: center;
+    justify-content: center;
+    cursor: pointer;
+    transition: all 0.2s ease;
+    font-size: 1.1rem;
+    box-shadow: 0 2px 6px rgba(0,0,0,0.2);
+}
+
+.action-button:hover {
+    transform: scale(1.1);
+}
+
+.action-button.liked {
+    color: #ff4d4d !important;
+}
+
+.action-button.added {
+    color: #4CAF50 !important;
+}
+
+/* Plus icon styling */
+.plus-icon {
+    display: inline-block;
+    width: 18px;
+    height: 18px;
+    position: relative;
+}
+
+.plus-icon::before, .plus-icon::after {
+    content: "";
+    position: absolute;
+    background: currentColor;
+}
+
+.plus-icon::before {
+    left: 50%;
+    top: 0;
+    width: 2px;
+    height: 100%;
+    margin-left: -1px;
+}
+
+.plus-icon::after {
+    top: 50%;
+    left: 0;
+    width: 100%;
+    height: 2px;
+    margin-top: -1px;
+}
+
+/* Hover panel styling - UPDATED FOR TL;DR */
+.hover-panel {
+    position: absolute;
+    bottom: 0;
+    left: 0;
+    right: 0;
+    height: 12.5%;
+    background: linear-gradient(to top, rgba(0,0,0,0.95) 0%, rgba(0,0,0,0.8) 70%, transparent 100%);
+    color: white;
+    padding: 8px 12px;
+    transition: all 0.3s ease;
+    z-index: 2;
+    overflow: hidden;
+    backdrop-filter: blur(2px);
+    opacity: 0;
+    transform: translateY(10px);
+}
+
+/* Expanded state */
+.movie-tile.expanded .hover-panel {
+    height: 100%;
+    background: rgba(0, 0, 0, 0.95);
+    backdrop-filter: blur(4px);
+    overflow-y: auto;
+    padding: 16px;
+    opacity: 1;
+    transform: translateY(0);
+}
+
+/* Hide scrollbar */
+.movie-tile.expanded .hover-panel::-webkit-scrollbar {
+    display: none;
+}
+
+.movie-tile.expanded .hover-panel {
+    -ms-overflow-style: none;
+    scrollbar-width: none;
+}
+
+/* Hover behaviors */
+.movie-tile:hover .hover-panel:not(.expanded) {
+    opacity: 1;
+    transform: translateY(0);
+}
+
+.movie-tile.expanded:not(:hover) .hover-panel {
+    opacity: 0;
+    transform: translateY(10px);
+}
+
+/* Hide buttons when expanded */
+.movie-tile.expanded .action-buttons {
+    display: none;
+}
+
+/* Show buttons on hover */
+.movie-tile:hover .action-buttons:not(.expanded) {
+    opacity: 1;
+}
+
+/* Panel content - UPDATED FOR TL;DR */
+.hover-title {
+    font-weight: 700;
+    font-size: 1.1rem;
+    margin-bottom: 4px;
+    display: -webkit-box;
+    -webkit-line-clamp: 2;
+    -webkit-box-orient: vertical;
+    overflow: hidden;
+    text-shadow: 0 1px 3px rgba(0,0,0,0.7);
+}
+
+/* TL;DR Section in Hover Panel */
+.tldr-section {
+    margin-top: 8px;
+    padding-top: 8px;
+    border-top: 1px solid rgba(255,255,255,0.2);
+}
+
+.tldr-label {
+    font-weight: 600;
+    font-size: 0.8rem;
+    color: #FFD700;
+    margin-bottom: 4px;
+    display: flex;
+    align-items: center;
+    gap: 4px;
+}
+
+.tldr-summary {
+    font-size: 0.8rem;
+    line-height: 1.3;
+    margin-bottom: 6px;
+    color: #ffffff;
+}
+
+.tldr-themes {
+    display: flex;
+    flex-wrap: wrap;
+    gap: 4px;
+    margin-bottom: 6px;
+}
+
+.tldr-theme-tag {
+    background: rgba(255, 215, 0, 0.2);
+    color: #FFD700;
+    padding: 2px 6px;
+    border-radius: 8px;
+    font-size: 0.7rem;
+    border: 1px solid rgba(255, 215, 0, 0.3);
+}
+
+.tldr-flags {
+    display: flex;
+    gap: 6px;
+    font-size: 0.75rem;
+    opacity: 0.8;
+}
+
+/* Full overview section (shown only when expanded) */
+.full-overview-section {
+    margin-top: 12px;
+    padding-top: 12px;
+    border-top: 1px solid rgba(255,255,255,0.2);
+    display: none;
+}
+
+.full-overview-label {
+    font-weight: 600;
+    font-size: 0.8rem;
+    color: #4FC3F7;
+    margin-bottom: 6px;
+    display: flex;
+    align-items: center;
+    gap: 4px;
+}
+
+.hover-full-overview {
+    font-size: 0.8rem;
+    line-height: 1.4;
+    color: #dddddd;
+}
+
+.movie-tile.expanded .full-overview-section {
+    display: block;
+}
+
+/* ===== PERFECT METADATA LAYOUT ===== */
+.movie-info {
+    margin-top: 0.8rem;
+    padding: 0;
+    display: flex;
+    flex-direction: column;
+    gap: 0.6rem;
+    width: 100%;
+    position: relative;
+}
+
+.movie-title {
+    font-weight: 600;
+    font-size: clamp(0.95rem, 1.6vw, 1.05rem);
+    margin: 0;
+    padding: 0;
+    white-space: nowrap;
+    overflow: hidden;
+    text-overflow: ellipsis;
+    color: var(--mp-text);
+    line-height: 1.3;
+    transition: all 0.2s ease;
+}
+
+.movie-meta {
+    font-size: clamp(0.78rem, 1.4vw, 0.88rem);
+    margin: 0;
+    padding: 0;
+    display: flex;
+    gap: 1.1rem;
+    color: var(--mp-meta);
+    line-height: 1.3;
+    flex-wrap: nowrap;
+    overflow: hidden;
+    justify-content: center;
+}
+
+.movie-meta span {
+    white-space: nowrap;
+    flex-shrink: 0;
+    display: inline-flex;
+    align-items: center;
+    gap: 0.25rem;
+}
+
+.movie-genres {
+    display: flex;
+    gap: 0.7rem;
+    flex-wrap: wrap;
+    margin: 0;
+    padding: 0;
+    justify-content: flex-start;
+}
+
+.genre-tag {
+    background: var(--mp-genre-bg);
+    color: var(--mp-genre-fg);
+    padding: 0.3rem 0.8rem;
+    border-radius: 12px;
+    font-size: clamp(0.68rem, 1.2vw, 0.78rem);
+    border: 1px solid var(--mp-genre-border);
+    line-height: 1.3;
+    flex-shrink: 0;
+}
+
+.genre-tag.no-genres {
+    font-style: italic;
+    opacity: 0.7;
+}
+
+/* Mobile optimizations */
+@media (max-width: 480px) {
+    .movie-meta {
+        gap: 0.8rem;
+        font-size: 0.75rem;
+        justify-content: flex-start;
+    }
+    
+    .movie-title {
+        font-size: 0.9rem;
+    }
+    
+    .genre-tag {
+        font-size: 0.65rem;
+        padding: 0.25rem 0.7rem;
+    }
+    
+    .movie-info {
+        margin-top: 0.7rem;
+        gap: 0.5rem;
+    }
+    
+    .action-button {
+        width: 38px;
+        height: 38px;
+        font-size: 1rem;
+    }
+}
+</style>
+"""
+
+# Shared tile handlers - identical for every tile, so nothing is interpolated.
+# A single delegated listener reads tile/button data-* attributes instead of
+# each tile defining its own copies of the functions.
+_TILE_JS = """
+<script>
+const TILE_ACTIONS = {
+    like: {
+        activeClass: 'liked',
+        on: '❤️', off: '🤍',
+        onLabel: 'Unlike this movie', offLabel: 'Like this movie'
+    },
+    watchlist: {
+        activeClass: 'added',
+        on: '✅', off: '<span class="plus-icon"></span>',
+        onLabel: 'Remove from watchlist', offLabel: 'Add to watchlist'
+    }
+};
+
+function postTileMessage(payload) {
+    window.parent.postMessage({
+        type: "streamlit:setComponentValue",
+        value: JSON.stringify(payload)
+    }, "*");
+}
+
+// Hover panels ship inside an inert <template>; mount one the first time its
+// tile is hovered, touched or clicked so offscreen tiles never build the DOM.
+function hydrateTile(tile) {
+    const tpl = tile.querySelector('template[data-role="hover-template"]');
+    if (tpl) tpl.replaceWith(tpl.content);
+}
+
+function handleTileClick(event, tile) {
+    const { movieId, title } = tile.dataset;
+
+    // Poster clicks follow the tile link (a new tab, since the sandboxed
+    // frame may not navigate the top window) and leave the panel alone
+    if (event.target.closest('.movie-tile-link')) return;
+
+    // If clicking the overlay
+    const wasExpanded = tile.classList.contains('expanded');
+    tile.classList.toggle('expanded');
+
+    if (!wasExpanded) {
+        tile.querySelector('[data-role="hover-panel"]').scrollTop = 0;
+
+        // Send analytics event for panel expansion
+        postTileMessage({
+            type: "analytics",
+            category: "engagement",
+            action: "panel_expand",
+            movie_id: movieId,
+            movie_title: title
+        });
+    }
+}
+
+function handleTileAction(btn, tile) {
+    const action = btn.dataset.action;
+    const cfg = TILE_ACTIONS[action];
+    if (!cfg) return;
+
+    const active = !btn.classList.contains(cfg.activeClass);
+    btn.classList.toggle(cfg.activeClass);
+    btn.innerHTML = active ? cfg.on : cfg.off;
+    btn.setAttribute('aria-label', active ? cfg.onLabel : cfg.offLabel);
+
+    // Bounce animation
+    btn.style.transform = 'scale(1.2)';
+    setTimeout(() => { btn.style.transform = 'scale(1)'; }, 200);
+
+    // Send movie tile action to Streamlit
+    postTileMessage({
+        type: "movieTileAction",
+        action: action,
+        tile_id: tile.dataset.tileId,
+        state: active,
+        title: tile.dataset.title,
+        movie_id: tile.dataset.movieId
+    });
+}
+
+['mouseover', 'touchstart'].forEach((type) => {
+    document.addEventListener(type, (event) => {
+        const tile = event.target.closest('.movie-tile');
+        if (tile) hydrateTile(tile);
+    }, { passive: true });
+});
+
+document.addEventListener('click', (event) => {
+    const tile = event.target.closest('.movie-tile');
+    if (!tile) return;
+    hydrateTile(tile);
+
+    const btn = event.target.closest('.action-button');
+    if (btn) {
+        event.stopPropagation();
+        handleTileAction(btn, tile);
+        return;
+    }
+    handleTileClick(event, tile);
+});
+</script>
+"""
+
+_TOAST_MESSAGES = MappingProxyType({
+    "like": "Liked",
+    "unlike": "Removed like",
+    "watchlist_add": "Added to watchlist",
+    "watchlist_remove": "Removed from watchlist",
+})
 
 def show_movie_toast(
     action_type: Literal["like", "unlike", "watchlist_add", "watchlist_remove"],
@@ -22,715 +620,462 @@ def show_movie_toast(
     icon: str = "🎬",
     duration: int = 3000
 ):
-    """Enhanced toast notification system for movie actions"""
-    # ... (keep your existing toast implementation) ...
+    """
+    Toast notification for movie actions.
 
-def MovieTile(
-    movie_data: Union[dict, object],
-    testid_suffix: Optional[str] = None,
-    lazy_load: bool = True,
-    debug: bool = False,
-    tldr_data: Optional[dict] = None,
-    **kwargs
-):
+    Uses Streamlit's native toast stack, so repeated actions share one
+    container instead of each mounting its own iframe and stylesheet.
+    ``duration`` is in milliseconds; st.toast takes whole seconds.
     """
-    Movie Tile Component v4.1 - Enhanced with TL;DR preview in hover panel
-    - Zoom effect on hover
-    - TL;DR preview display in hover panel instead of TMDB overview
-    - Optimized for large grids
-    - Integrated navigation and analytics logging
+    st.toast(
+        f"{_TOAST_MESSAGES[action_type]}: {movie_title}",
+        icon=icon,
+        duration=max(1, round(duration / 1000))
+    )
+
+def _extract_tile_fields(
+    movie_id: str,
+    movie_data: Mapping,
+    tldr_data: Optional[dict],
+    ncols: int = 1
+) -> dict:
     """
+    Extract and escape the display fields for one tile.
 
-    # ===== DATA EXTRACTION =====
-    if not movie_data:
-        if debug:
-            st.error("No movie data provided")
-        return None
+    Not cached itself: the work is a handful of dict lookups, and the markup
+    built from these fields is memoised by _tile_markup.
+    """
+    # Merge once: top-level values win, 'details' fills keys missing or None.
+    # Each display field is escaped exactly once below.
+    merged = {
+        **(movie_data.get('details') or {}),
+        **{k: v for k, v in movie_data.items() if v is not None}
+    }
 
-    if not isinstance(movie_data, dict):
-        try:
-            movie_data = vars(movie_data)
-        except TypeError:
-            if debug:
-                st.error("Invalid movie data format")
-            return None
-    
-    # ===== EXTRACT MOVIE ID =====
-    movie_id = str(movie_data.get('id') or movie_data.get('details', {}).get('id') or '')
-    
-    # Safely extract and escape data
     def safe_get(key, default=''):
-        val = movie_data.get(key)
-        if val is None:
-            details = movie_data.get('details', {})
-            val = details.get(key, default)
-        return html.escape(str(val)) if val is not None else default
+        val = merged.get(key)
+        return str(val) if val is not None else default
 
-    title = safe_get('title', 'Untitled')[:50]
+    # Long titles are ellipsized by CSS, not sliced here
+    title = _esc(safe_get('title', 'Untitled'))
     release_date = safe_get('release_date')
-    release_year = release_date[:4] if release_date and len(release_date) >= 4 else 'N/A'
+    # Typed fields are validated rather than escaped: a year is four digits
+    release_year = release_date[:4] if release_date[:4].isdigit() else 'N/A'
     
     try:
-        rating = float(movie_data.get('vote_average', 0))
+        rating = float(merged.get('vote_average', 0))
         rating_str = f"{rating:.1f}" if rating > 0 else 'N/A'
     except (TypeError, ValueError):
         rating_str = "N/A"
 
     runtime_str = "N/A"
-    runtime = movie_data.get('runtime') or movie_data.get('details', {}).get('runtime')
+    invalid_runtime = None
+    runtime = merged.get('runtime')
     if runtime:
         try:
             mins = int(runtime)
             if mins > 0:
-                hours, mins = divmod(mins, 60)
-                runtime_str = f"{hours}h {mins:02d}m" if hours else f"{mins}m"
+                runtime_str = _RUNTIME_STR.get(mins) or _format_runtime(mins)
         except (TypeError, ValueError):
-            if debug:
-                st.warning(f"Invalid runtime: {runtime}")
+            invalid_runtime = runtime
 
-    overview = safe_get('overview', 'No description available')
-    short_overview = (overview[:90] + "...") if len(overview) > 90 else overview
-    full_overview = overview if overview != "No description available" else "Description coming soon"
+    # Escape only real overviews; the placeholder is a constant
+    overview = safe_get('overview')
+    full_overview = _esc(overview) if overview else "Description coming soon"
 
-    genres = movie_data.get('genres') or movie_data.get('details', {}).get('genres', [])
-    genre_tags = (
-        [html.escape(g['name']) for g in genres if isinstance(g, dict) and g.get('name')] or
-        [html.escape(g.name) for g in genres if hasattr(g, 'name')] or
-        [html.escape(str(g)) for g in genres if g]
-    )[:3] or ["No genres"]
+    genres = merged.get('genres') or []
+    # Single pass over genres (dicts, Genre objects or plain strings), stopping at 3
+    genre_tags = []
+    for g in genres:
+        if isinstance(g, dict):
+            name = g.get('name')
+        else:
+            name = getattr(g, 'name', None) or (str(g) if g else None)
+        if name:
+            genre_tags.append(_esc(str(name)))
+            if len(genre_tags) == 3:
+                break
+    genres_html = (
+        '<span class="genre-tag">'
+        + '</span><span class="genre-tag">'.join(genre_tags)
+        + '</span>' if genre_tags else '<span class="genre-tag no-genres">No genres</span>'
+    )
 
     poster_path = safe_get('poster_path')
-    if not poster_path:
-        image_url = "https://via.placeholder.com/300x450?text=No+Poster"
-    elif poster_path.startswith(('http://', 'https://')):
-        image_url = poster_path
-    else:
-        image_url = f"https://image.tmdb.org/t/p/w500{poster_path}"
-
-    # Process TL;DR data - check if tldr_data is provided or if it's in movie_data
-    tldr_summary = ""
-    tldr_themes = []
-    tldr_flags = []
-    
-    # First check if tldr_data parameter is provided
-    if tldr_data:
-        tldr_summary = html.escape(tldr_data.get('summary', ''))
-        tldr_themes = [html.escape(theme) for theme in tldr_data.get('themes', [])[:3]]
-        tldr_flags = [html.escape(flag) for flag in tldr_data.get('flags', [])[:2]]
-    # If not, check if there's tldr data in the movie_data itself
-    elif 'tldr' in movie_data and movie_data['tldr']:
-        tldr_data = movie_data['tldr']
-        tldr_summary = html.escape(tldr_data.get('summary', ''))
-        tldr_themes = [html.escape(theme) for theme in tldr_data.get('themes', [])[:3]]
-        tldr_flags = [html.escape(flag) for flag in tldr_data.get('flags', [])[:2]]
-
-    # ===== STATE & THEME MANAGEMENT =====
-    tile_key = f"mt_{hash(title)}_{testid_suffix or '0'}"
-    liked_key = f"{tile_key}_liked"
-    watchlist_key = f"{tile_key}_watchlisted"
-    
-    if liked_key not in st.session_state:
-        st.session_state[liked_key] = False
-    if watchlist_key not in st.session_state:
-        st.session_state[watchlist_key] = False
+    image_url = _esc(_resolve_poster(poster_path))
+    poster_srcset = _poster_srcset_attrs(poster_path, ncols)
 
-    # Detect theme
-    try:
-        theme = st.get_option("theme.base") or "light"
-        is_dark = theme == "dark"
-        text_color = "#ffffff" if is_dark else "#111111"
-        meta_color = "#aaaaaa" if is_dark else "#666666"
-        genre_bg = "rgba(255,255,255,0.1)" if is_dark else "rgba(0,0,0,0.05)"
-        genre_color = "#cccccc" if is_dark else "#555555"
-        genre_border = "#444444" if is_dark else "#eeeeee"
-    except:
-        is_dark = False
-        text_color = "#111111"
-        meta_color = "#666666"
-        genre_bg = "rgba(0,0,0,0.05)"
-        genre_color = "#555555"
-        genre_border = "#eeeeee"
+    # TL;DR data: the tldr_data argument wins, else the movie's own 'tldr' entry.
+    # Keys may be present but None, so each falls back to an empty value.
+    tldr_data = tldr_data or movie_data.get('tldr') or {}
+    tldr_summary = _esc(str(tldr_data.get('summary') or ''))
+    tldr_themes = tuple(_esc(str(theme)) for theme in (tldr_data.get('themes') or ())[:3])
+    tldr_flags = tuple(_esc(str(flag)) for flag in (tldr_data.get('flags') or ())[:2])
 
-    # ===== COMPONENT TEMPLATE =====
-    html_content = f"""
-    <style>
-    /* Container - Perfect spacing */
-    .movie-tile-container-{tile_key} {{
-        width: 100%;
-        margin-bottom: 0.5rem !important;
-        position: relative;
-    }}
-    
-    /* Poster container with enhanced hover effects */
-    .movie-tile-{tile_key} {{
-        position: relative;
-        width: 100%;
-        aspect-ratio: 2/3;
-        border-radius: 8px;
-        overflow: hidden;
-        cursor: pointer;
-        margin-bottom: 0 !important;
-        transition: all 0.3s ease;
-        box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-        transform-origin: center;
-    }}
-    
-    /* Enhanced hover effects */
-    .movie-tile-{tile_key}:hover {{
-        transform: scale(1.05);
-        box-shadow: 0 8px 25px rgba(0,0,0,0.15);
-        z-index: 10;
-    }}
-    
-    /* Poster image with subtle hover effect */
-    .movie-poster-{tile_key} {{
-        width: 100%;
-        height: 100%;
-        object-fit: cover;
-        display: block;
-        transition: all 0.3s ease;
-    }}
-    
-    .movie-tile-{tile_key}:hover .movie-poster-{tile_key} {{
-        transform: scale(1.08);
-        filter: brightness(1.05);
-    }}
-    
-    /* Action buttons */
-    .action-buttons-{tile_key} {{
-        position: absolute;
-        top: 50%;
-        left: 50%;
-        transform: translate(-50%, -50%);
-        display: flex;
-        gap: 16px;
-        z-index: 3;
-        opacity: 0;
-        transition: opacity 0.2s ease;
-        pointer-events: none;
-    }}
-    
-    .action-button-{tile_key} {{
-        pointer-events: auto;
-        background: rgba(255, 255, 255, 0.9);
-        border: none;
-        border-radius: 50%;
-        width: 42px;
-        height: 42px;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        cursor: pointer;
-        transition: all 0.2s ease;
-        font-size: 1.1rem;
-        box-shadow: 0 2px 6px rgba(0,0,0,0.2);
-    }}
-    
-    .action-button-{tile_key}:hover {{
-        transform: scale(1.1);
-    }}
-    
-    .action-button-{tile_key}.liked {{
-        color: #ff4d4d !important;
-    }}
-    
-    .action-button-{tile_key}.added {{
-        color: #4CAF50 !important;
-    }}
-    
-    /* Plus icon styling */
-    .plus-icon {{
-        display: inline-block;
-        width: 18px;
-        height: 18px;
-        position: relative;
-    }}
-    
-    .plus-icon::before, .plus-icon::after {{
-        content: "";
-        position: absolute;
-        background: currentColor;
-    }}
-    
-    .plus-icon::before {{
-        left: 50%;
-        top: 0;
-        width: 2px;
-        height: 100%;
-        margin-left: -1px;
-    }}
-    
-    .plus-icon::after {{
-        top: 50%;
-        left: 0;
-        width: 100%;
-        height: 2px;
-        margin-top: -1px;
-    }}
-    
-    /* Hover panel styling - UPDATED FOR TL;DR */
-    .hover-panel-{tile_key} {{
-        position: absolute;
-        bottom: 0;
-        left: 0;
-        right: 0;
-        height: 12.5%;
-        background: linear-gradient(to top, rgba(0,0,0,0.95) 0%, rgba(0,0,0,0.8) 70%, transparent 100%);
-        color: white;
-        padding: 8px 12px;
-        transition: all 0.3s ease;
-        z-index: 2;
-        overflow: hidden;
-        backdrop-filter: blur(2px);
-        opacity: 0;
-        transform: translateY(10px);
-    }}
-    
-    /* Expanded state */
-    .movie-tile-{tile_key}.expanded .hover-panel-{tile_key} {{
-        height: 100%;
-        background: rgba(0, 0, 0, 0.95);
-        backdrop-filter: blur(4px);
-        overflow-y: auto;
-        padding: 16px;
-        opacity: 1;
-        transform: translateY(0);
-    }}
-    
-    /* Hide scrollbar */
-    .movie-tile-{tile_key}.expanded .hover-panel-{tile_key}::-webkit-scrollbar {{
-        display: none;
-    }}
-    
-    .movie-tile-{tile_key}.expanded .hover-panel-{tile_key} {{
-        -ms-overflow-style: none;
-        scrollbar-width: none;
-    }}
-    
-    /* Hover behaviors */
-    .movie-tile-{tile_key}:hover .hover-panel-{tile_key}:not(.expanded) {{
-        opacity: 1;
-        transform: translateY(0);
-    }}
-    
-    .movie-tile-{tile_key}.expanded:not(:hover) .hover-panel-{tile_key} {{
-        opacity: 0;
-        transform: translateY(10px);
-    }}
-    
-    /* Hide buttons when expanded */
-    .movie-tile-{tile_key}.expanded .action-buttons-{tile_key} {{
-        display: none;
-    }}
-    
-    /* Show buttons on hover */
-    .movie-tile-{tile_key}:hover .action-buttons-{tile_key}:not(.expanded) {{
-        opacity: 1;
-    }}
-    
-    /* Panel content - UPDATED FOR TL;DR */
-    .hover-title-{tile_key} {{
-        font-weight: 700;
-        font-size: 1.1rem;
-        margin-bottom: 4px;
-        text-shadow: 0 1px 3px rgba(0,0,0,0.7);
-    }}
-    
-    .hover-meta-{tile_key} {{
-        font-size: 0.85rem;
-        color: #dddddd;
-        margin-bottom: 4px;
-        display: flex;
-        gap: 10px;
-        flex-wrap: wrap;
-    }}
-    
-    /* TL;DR Section in Hover Panel */
-    .tldr-section-{tile_key} {{
-        margin-top: 8px;
-        padding-top: 8px;
-        border-top: 1px solid rgba(255,255,255,0.2);
-    }}
-    
-    .tldr-label-{tile_key} {{
-        font-weight: 600;
-        font-size: 0.8rem;
-        color: #FFD700;
-        margin-bottom: 4px;
-        display: flex;
-        align-items: center;
-        gap: 4px;
-    }}
-    
-    .tldr-summary-{tile_key} {{
-        font-size: 0.8rem;
-        line-height: 1.3;
-        margin-bottom: 6px;
-        color: #ffffff;
-    }}
-    
-    .tldr-themes-{tile_key} {{
-        display: flex;
-        flex-wrap: wrap;
-        gap: 4px;
-        margin-bottom: 6px;
-    }}
-    
-    .tldr-theme-tag-{tile_key} {{
-        background: rgba(255, 215, 0, 0.2);
-        color: #FFD700;
-        padding: 2px 6px;
-        border-radius: 8px;
-        font-size: 0.7rem;
-        border: 1px solid rgba(255, 215, 0, 0.3);
-    }}
-    
-    .tldr-flags-{tile_key} {{
-        display: flex;
-        gap: 6px;
-        font-size: 0.75rem;
-        opacity: 0.8;
-    }}
-    
-    /* Full overview section (shown only when expanded) */
-    .full-overview-section-{tile_key} {{
-        margin-top: 12px;
-        padding-top: 12px;
-        border-top: 1px solid rgba(255,255,255,0.2);
-        display: none;
-    }}
-    
-    .full-overview-label-{tile_key} {{
-        font-weight: 600;
-        font-size: 0.8rem;
-        color: #4FC3F7;
-        margin-bottom: 6px;
-        display: flex;
-        align-items: center;
-        gap: 4px;
-    }}
-    
-    .hover-full-overview-{tile_key} {{
-        font-size: 0.8rem;
-        line-height: 1.4;
-        color: #dddddd;
-    }}
-    
-    .movie-tile-{tile_key}.expanded .full-overview-section-{tile_key} {{
-        display: block;
-    }}
-    
-    /* ===== PERFECT METADATA LAYOUT ===== */
-    .movie-info-{tile_key} {{
-        margin-top: 0.8rem;
-        padding: 0;
-        display: flex;
-        flex-direction: column;
-        gap: 0.6rem;
-        width: 100%;
-        position: relative;
-    }}
-    
-    .movie-title-{tile_key} {{
-        font-weight: 600;
-        font-size: clamp(0.95rem, 1.6vw, 1.05rem);
-        margin: 0;
-        padding: 0;
-        white-space: nowrap;
-        overflow: hidden;
-        text-overflow: ellipsis;
-        color: {text_color};
-        line-height: 1.3;
-        transition: all 0.2s ease;
-    }}
-    
-    .movie-meta-{tile_key} {{
-        font-size: clamp(0.78rem, 1.4vw, 0.88rem);
-        margin: 0;
-        padding: 0;
-        display: flex;
-        gap: 1.1rem;
-        color: {meta_color};
-        line-height: 1.3;
-        flex-wrap: nowrap;
-        overflow: hidden;
-        justify-content: center;
-    }}
-    
-    .movie-meta-{tile_key} span {{
-        white-space: nowrap;
-        flex-shrink: 0;
-        display: inline-flex;
-        align-items: center;
-        gap: 0.25rem;
-    }}
-    
-    .movie-genres-{tile_key} {{
-        display: flex;
-        gap: 0.7rem;
-        flex-wrap: wrap;
-        margin: 0;
-        padding: 0;
-        justify-content: flex-start;
-    }}
-    
-    .genre-tag-{tile_key} {{
-        background: {genre_bg};
-        color: {genre_color};
-        padding: 0.3rem 0.8rem;
-        border-radius: 12px;
-        font-size: clamp(0.68rem, 1.2vw, 0.78rem);
-        border: 1px solid {genre_border};
-        line-height: 1.3;
-        flex-shrink: 0;
-    }}
-
-    /* Mobile optimizations */
-    @media (max-width: 480px) {{
-        .movie-meta-{tile_key} {{
-            gap: 0.8rem;
-            font-size: 0.75rem;
-            justify-content: flex-start;
-        }}
-        
-        .movie-title-{tile_key} {{
-            font-size: 0.9rem;
-        }}
-        
-        .genre-tag-{tile_key} {{
-            font-size: 0.65rem;
-            padding: 0.25rem 0.7rem;
-        }}
-        
-        .movie-info-{tile_key} {{
-            margin-top: 0.7rem;
-            gap: 0.5rem;
-        }}
-        
-        .action-button-{tile_key} {{
-            width: 38px;
-            height: 38px;
-            font-size: 1rem;
-        }}
-    }}
-    </style>
-    
-    <div class="movie-tile-container-{tile_key}">
-        <div id="tile-{tile_key}" class="movie-tile-{tile_key}"
+    return dict(
+        movie_id=movie_id,
+        title=title,
+        release_year=release_year,
+        rating_str=rating_str,
+        runtime_str=runtime_str,
+        invalid_runtime=invalid_runtime,
+        full_overview=full_overview,
+        genres_html=genres_html,
+        image_url=image_url,
+        poster_srcset=poster_srcset,
+        tldr_summary=tldr_summary,
+        tldr_themes=tldr_themes,
+        tldr_flags=tldr_flags,
+    )
+
+# Tile markup, compiled once at import and filled per tile with substitute().
+# $-placeholders leave literal braces in the markup alone. Every value is
+# pre-escaped by _extract_tile_fields / _render_tile_html.
+_TILE_TMPL = Template("""
+    <div class="movie-tile-container" data-theme="${theme}">
+        <div class="movie-tile"
+             data-tile-id="${tile_key}"
+             data-movie-id="${movie_id}"
+             data-title="${title}"
              ontouchstart="this.classList.add('touched')"
-             ontouchend="setTimeout(() => this.classList.remove('touched'), 500)"
-             onclick="handleTileClick(event, '{tile_key}')">
+             ontouchend="setTimeout(() => this.classList.remove('touched'), 500)">
             
-            <!-- Poster Image -->
-            <img class="movie-poster-{tile_key}" 
-                 src="{image_url}" 
-                 alt="{title}"
-                 loading="{'lazy' if lazy_load else 'eager'}"
-                 onerror="this.onerror=null;this.src='https://via.placeholder.com/300x450?text=No+Poster'">
+            <!-- Poster Image (plain link to the details page, no widget round-trip) -->
+            <a class="movie-tile-link" href="${details_page}?id=${movie_id}" target="_blank" rel="noopener">
+            <img class="movie-poster" 
+                 data-role="poster"
+                 src="${image_url}" 
+                 ${poster_srcset}
+                 width="300" height="450"
+                 alt="${title}"
+                 loading="${loading}"
+                 decoding="async"
+                 fetchpriority="${fetchpriority}"
+                 onerror="this.onerror=null;this.src='${fallback_src}'">
+            </a>
             
             <!-- Action Buttons -->
-            <div class="action-buttons-{tile_key}">
-                <button id="like-{tile_key}" 
-                        class="action-button-{tile_key} {'liked' if st.session_state.get(liked_key) else ''}"
-                        onclick="handleLike(event, '{tile_key}', '{liked_key}', `{title.replace('`', '\\`')}`, '{movie_id}')"
-                        aria-label="{'Unlike' if st.session_state.get(liked_key) else 'Like'} this movie">
-                    {'❤️' if st.session_state.get(liked_key) else '🤍'}
+            <div class="action-buttons">
+                <button class="action-button ${like_class}"
+                        data-action="like"
+                        aria-label="${like_label} this movie">
+                    ${like_icon}
                 </button>
-                <button id="watchlist-{tile_key}" 
-                        class="action-button-{tile_key} {'added' if st.session_state.get(watchlist_key) else ''}"
-                        onclick="handleWatchlist(event, '{tile_key}', '{watchlist_key}', `{title.replace('`', '\\`')}`, '{movie_id}')"
-                        aria-label="{'Remove from' if st.session_state.get(watchlist_key) else 'Add to'} watchlist">
-                    {'✅' if st.session_state.get(watchlist_key) else '<span class="plus-icon"></span>'}
+                <button class="action-button ${watchlist_class}"
+                        data-action="watchlist"
+                        aria-label="${watchlist_label} watchlist">
+                    ${watchlist_icon}
                 </button>
             </div>
             
-            <!-- Hover Panel - UPDATED TO SHOW TL;DR -->
-            <div class="hover-panel-{tile_key}">
-                <div class="hover-title-{tile_key}">{title}</div>
-                <div class="hover-meta-{tile_key}">
-                    <span>🗓 {release_year}</span>
-                    <span>⭐ {rating_str}</span>
-                    <span>⏱ {runtime_str}</span>
-                </div>
+            <!-- Hover Panel - UPDATED TO SHOW TL;DR (inert until first hover, see hydrateTile) -->
+            <template data-role="hover-template">
+            <div class="hover-panel" data-role="hover-panel">
+                <div class="hover-title">${title}</div>
                 
                 <!-- TL;DR Section -->
-                <div class="tldr-section-{tile_key}">
-                    <div class="tldr-label-{tile_key}">📝 TL;DR Preview:</div>
-                    {f'<div class="tldr-summary-{tile_key}">"{tldr_summary}"</div>' if tldr_summary else f'<div class="tldr-summary-{tile_key}">No TL;DR available yet</div>'}
+                <div class="tldr-section">
+                    <div class="tldr-label">📝 TL;DR Preview:</div>
+                    ${tldr_summary_html}
                     
-                    {f'<div class="tldr-themes-{tile_key}">{"".join(f"<span class=\"tldr-theme-tag-{tile_key}\">{theme}</span>" for theme in tldr_themes)}</div>' if tldr_themes else ''}
+                    ${tldr_themes_html}
                     
-                    {f'<div class="tldr-flags-{tile_key}">{" ".join(tldr_flags)}</div>' if tldr_flags else ''}
+                    ${tldr_flags_html}
                 </div>
                 
                 <!-- Full Overview Section (shown only when expanded) -->
-                <div class="full-overview-section-{tile_key}">
-                    <div class="full-overview-label-{tile_key}">🌐 Full Overview:</div>
-                    <div class="hover-full-overview-{tile_key}">{full_overview}</div>
+                <div class="full-overview-section">
+                    <div class="full-overview-label">🌐 Full Overview:</div>
+                    <div class="hover-full-overview">${full_overview}</div>
                 </div>
             </div>
+            </template>
         </div>
         
         <!-- Visible Metadata - PERFECT SPACING -->
-        <div class="movie-info-{tile_key}">
-            <div class="movie-title-{tile_key}" title="{title}">{title}</div>
-            <div class="movie-meta-{tile_key}">
-                <span>🗓 {release_year}</span>
-                <span>⭐ {rating_str}</span>
-                <span>⏱ {runtime_str}</span>
+        <div class="movie-info">
+            <div class="movie-title" title="${title}">${title}</div>
+            <div class="movie-meta">
+                <span>🗓 ${release_year}</span>
+                <span>⭐ ${rating_str}</span>
+                <span>⏱ ${runtime_str}</span>
             </div>
-            <div class="movie-genres-{tile_key}">
-                {"".join(f'<span class="genre-tag-{tile_key}">{g}</span>' for g in genre_tags)}
+            <div class="movie-genres">
+                ${genres_html}
             </div>
         </div>
     </div>
-        
-    <script>
-    // Handle tile clicks
-    function handleTileClick(event, tileId) {{
-        const clickedElement = event.target;
-        const isActionButton = clickedElement.closest('.action-button-{tile_key}');
-        
-        if (!isActionButton) {{
-            const tile = document.getElementById(`tile-${{tileId}}`);
-            
-            // If clicking the poster (not the overlay)
-            if (clickedElement.classList.contains('movie-poster-{tile_key}')) {{
-                // Send navigation request to Streamlit
-                window.parent.postMessage({{
-                    type: "streamlit:setComponentValue",
-                    value: JSON.stringify({{
-                        type: "navigation",
-                        action: "navigate_to_movie_details",
-                        movie_id: "{movie_id}",
-                        movie_title: "{title}"
-                    }})
-                }}, "*");
-                return;
-            }}
-            
-            // If clicking the overlay
-            const wasExpanded = tile.classList.contains('expanded');
-            tile.classList.toggle('expanded');
-            
-            if (!wasExpanded) {{
-                const panel = tile.querySelector('.hover-panel-{tile_key}');
-                panel.scrollTop = 0;
-                
-                // Send analytics event for panel expansion
-                window.parent.postMessage({{
-                    type: "streamlit:setComponentValue",
-                    value: JSON.stringify({{
-                        type: "analytics",
-                        category: "engagement",
-                        action: "panel_expand",
-                        movie_id: "{movie_id}",
-                        movie_title: "{title}"
-                    }})
-                }}, "*");
-            }}
-        }}
-    }}
-
-    function handleLike(event, tileId, likeKey, title, movie_id) {{
-        event.stopPropagation();
-        const btn = document.getElementById(`like-${{tileId}}`);
-        if (!btn) return;
-
-        const liked = !btn.classList.contains('liked');
-        btn.classList.toggle('liked');
-        btn.innerHTML = liked ? '❤️' : '🤍';
-        btn.setAttribute('aria-label', liked ? 'Unlike this movie' : 'Like this movie');
-
-        btn.style.transform = 'scale(1.2)';
-        setTimeout(() => {{ btn.style.transform = 'scale(1)'; }}, 200);
-
-        window.parent.postMessage({{
-            type: "streamlit:setComponentValue",
-            value: JSON.stringify({{
-                type: "movieTileAction",
-                action: "like",
-                key: likeKey,
-                state: liked,
-                title: title,
-                movie_id: movie_id
-            }})
-        }}, "*");
-    }}
-
-    function handleWatchlist(event, tileId, watchlistKey, title, movie_id) {{
-        event.stopPropagation();
-        const btn = document.getElementById(`watchlist-${{tileId}}`);
-        if (!btn) return;
+    """)
 
-        const added = !btn.classList.contains('added');
-        
-        btn.classList.toggle('added');
-        btn.innerHTML = added ? '✅' : '<span class="plus-icon"></span>';
-        btn.setAttribute('aria-label', added ? 'Remove from watchlist' : 'Add to watchlist');
-        
-        // Bounce animation
-        btn.style.transform = 'scale(1.2)';
-        setTimeout(() => {{ btn.style.transform = 'scale(1)'; }}, 200);
-        
-        // Send movie tile action to Streamlit
-        window.parent.postMessage({{
-            type: "streamlit:setComponentValue",
-            value: JSON.stringify({{
-                type: "movieTileAction",
-                action: "watchlist",
-                key: watchlistKey,
-                state: added,
-                title: title,
-                movie_id: movie_id
-            }})
-        }}, "*");
-    }}
-    </script>
+@st.cache_resource(show_spinner=False)
+def _compiled_assets(is_dark: bool) -> tuple[str, Template]:
+    """
+    Build the (stylesheet, tile template) pair for one theme.
+
+    Done lazily and once per server process rather than at import, so every
+    session shares the same two entries (light and dark).
+    """
+    # Only the active palette is emitted; the entry is already per theme
+    css = "\n<style>\n" + _palette_css(":root", _THEME[is_dark]) + _TILE_CSS_RULES
+    tmpl = Template(_TILE_TMPL.safe_substitute(
+        theme="dark" if is_dark else "light",
+        details_page=_details_page_url()
+    ))
+    return css, tmpl
+
+def _render_tile_html(
+    fields: dict,
+    tile_key: str,
+    tile_state: dict,
+    lazy_load: bool,
+    is_dark: bool,
+    high_priority: Optional[bool] = None
+) -> str:
+    """
+    Build the markup for a single tile from pre-escaped fields (no Streamlit calls).
+
+    high_priority sets the poster's fetchpriority; it defaults to eager tiles
+    being high priority and lazy ones low.
+    """
+    if high_priority is None:
+        high_priority = not lazy_load
+    # Every displayed field is a hashable primitive, so unchanged tiles are
+    # served from the markup cache on reruns. invalid_runtime is the raw value
+    # (possibly unhashable) kept for diagnostics only, so it stays out of the key.
+    return _tile_markup(
+        tuple(item for item in fields.items() if item[0] != 'invalid_runtime'),
+        tile_key,
+        tile_state['liked'],
+        tile_state['watchlisted'],
+        lazy_load,
+        is_dark,
+        high_priority
+    )
+
+@lru_cache(maxsize=4096)
+def _tile_markup(
+    field_items: tuple,
+    tile_key: str,
+    liked: bool,
+    watchlisted: bool,
+    lazy_load: bool,
+    is_dark: bool,
+    high_priority: bool
+) -> str:
+    fields = dict(field_items)
+    tldr_summary = fields['tldr_summary']
+    tldr_themes = fields['tldr_themes']
+    tldr_flags = fields['tldr_flags']
+
+    _, tmpl = _compiled_assets(is_dark)
+    return tmpl.substitute({
+        **fields,
+        'tile_key': tile_key,
+        'fallback_src': _FALLBACK_DATAURI,
+        'loading': 'lazy' if lazy_load else 'eager',
+        'fetchpriority': 'high' if high_priority else 'low',
+        'like_class': 'liked' if liked else '',
+        'like_label': 'Unlike' if liked else 'Like',
+        'like_icon': '❤️' if liked else '🤍',
+        'watchlist_class': 'added' if watchlisted else '',
+        'watchlist_label': 'Remove from' if watchlisted else 'Add to',
+        'watchlist_icon': '✅' if watchlisted else '<span class="plus-icon"></span>',
+        'tldr_summary_html': (
+            f'<div class="tldr-summary">"{tldr_summary}"</div>' if tldr_summary
+            else '<div class="tldr-summary">No TL;DR available yet</div>'
+        ),
+        'tldr_themes_html': (
+            '<div class="tldr-themes"><span class="tldr-theme-tag">'
+            + '</span><span class="tldr-theme-tag">'.join(tldr_themes)
+            + '</span></div>' if tldr_themes else ''
+        ),
+        'tldr_flags_html': f'<div class="tldr-flags">{" ".join(tldr_flags)}</div>' if tldr_flags else '',
+    })
+
+def MovieTile(
+    movie_data: Union[dict, object],
+    testid_suffix: Optional[str] = None,
+    lazy_load: bool = True,
+    debug: bool = False,
+    tldr_data: Optional[dict] = None,
+    is_dark: Optional[bool] = None,
+    **kwargs
+):
+    """
+    Movie Tile Component v4.1 - Enhanced with TL;DR preview in hover panel
+    - Zoom effect on hover
+    - TL;DR preview display in hover panel instead of TMDB overview
+    - Optimized for large grids
+    - Integrated navigation and analytics logging
+
+    Grids should resolve the theme once and pass ``is_dark``; when omitted the
+    tile reads ``theme.base`` itself.
+    """
+
+    # ===== DATA EXTRACTION =====
+    prepared = _prepare_tile(movie_data, testid_suffix, _DEBUG_ENABLED and debug, tldr_data)
+    if prepared is None:
+        return None
+    fields, tile_key, tile_state = prepared
+
+    # Detect theme (grids pass it in so the option is read once per render)
+    if is_dark is None:
+        is_dark = _get_theme() == "dark"
+
+    # ===== COMPONENT TEMPLATE =====
+    tile_html = _render_tile_html(
+        fields,
+        tile_key,
+        tile_state,
+        lazy_load,
+        is_dark
+    )
+
+    # Render stylesheet, markup and handlers as one payload
+    css, _ = _compiled_assets(is_dark)
+    components.html(f"{css}{tile_html}{_TILE_JS}", height=500)
+
+@lru_cache(maxsize=4096)
+def _tile_key(identity: str, suffix: Optional[str]) -> str:
+    """Stable tile key - unlike hash(), identical across reruns and processes."""
+    return f"mt_{hashlib.blake2s(identity.encode(), digest_size=6).hexdigest()}_{suffix or '0'}"
+
+# Tiles nobody has interacted with share this read-only state instead of
+# each getting its own session entry
+_DEFAULT_TILE_STATE = MappingProxyType({'liked': False, 'watchlisted': False})
+
+def _prune_stale_keys() -> None:
+    """Drop tile state entries that are back to the default (nothing liked or watchlisted)."""
+    tile_states = st.session_state.get('_tile_state')
+    if tile_states:
+        for key in [k for k, state in tile_states.items() if not any(state.values())]:
+            del tile_states[key]
+
+def _prepare_tile(
+    movie_data: Union[dict, object],
+    testid_suffix: Optional[str],
+    debug: bool = False,
+    tldr_data: Optional[dict] = None,
+    tldr_map: Optional[Mapping] = None,
+    ncols: int = 1
+) -> Optional[tuple]:
+    """
+    Normalise one movie into (fields, tile_key, tile_state), or None when the
+    data is unusable. Shared by MovieTile and MovieTileGrid.
+
+    When tldr_data is not given, it is looked up in tldr_map by the movie's id.
+    ncols is the number of grid columns the tile shares its frame with.
     """
+    if not movie_data:
+        if debug:
+            st.error("No movie data provided")
+        return None
+
+    # Mappings are used as-is; objects expose their live __dict__ (no copy)
+    if not isinstance(movie_data, Mapping):
+        movie_data = getattr(movie_data, '__dict__', None)
+        if movie_data is None:
+            if debug:
+                st.error("Invalid movie data format")
+            return None
     
-    # Render component with optimized height
-    components.html(html_content, height=500)
+    # ===== EXTRACT MOVIE FIELDS =====
+    raw_id = movie_data.get('id') or (movie_data.get('details') or {}).get('id')
+    movie_id = str(raw_id or '')
+    if tldr_data is None and tldr_map:
+        tldr_data = tldr_map.get(raw_id)
+    fields = _extract_tile_fields(movie_id, movie_data, tldr_data, ncols)
+    if debug and fields['invalid_runtime'] is not None:
+        st.warning(f"Invalid runtime: {fields['invalid_runtime']}")
+
+    # ===== STATE MANAGEMENT =====
+    # Keyed on the movie id where there is one, so retitled data keeps its state
+    tile_key = _tile_key(fields['movie_id'] or fields['title'], testid_suffix)
+    # Rendering only reads; entries are created when the user toggles something
+    tile_state = st.session_state.get('_tile_state', {}).get(tile_key, _DEFAULT_TILE_STATE)
+    return fields, tile_key, tile_state
+
+def MovieTileGrid(
+    movies: list,
+    ncols: int = 3,
+    lazy_load: bool = True,
+    is_dark: Optional[bool] = None,
+    row_height: Optional[int] = None,
+    tldr_map: Optional[Mapping] = None,
+    above_fold: int = 6,
+    frame_width: int = 1200
+):
+    """
+    Render a whole grid of movie tiles as a single component.
+
+    Builds every tile with the same markup as MovieTile, lays them out with a
+    CSS grid and ships stylesheet, poster preloads, tiles and handlers in one
+    components.html call, so the page gets one element instead of one iframe
+    per movie. tldr_map optionally maps movie ids to TL;DR data for the
+    matching tiles.
+
+    The first ``above_fold`` posters are preloaded ahead of the tiles and load
+    eagerly at high fetch priority; the rest are lazy (when lazy_load is set)
+    and low priority so they yield bandwidth to the visible ones.
+
+    The frame height follows the tile geometry at ``frame_width`` (the poster
+    scales with the column width) unless ``row_height`` is given; the frame
+    scrolls if the real width makes the tiles taller than that.
+    """
+    if is_dark is None:
+        is_dark = _get_theme() == "dark"
+
+    css, _ = _compiled_assets(is_dark)
+    # One flat buffer for the whole payload, joined once at the end
+    parts = [css, f'<div class="mt-grid" style="grid-template-columns: repeat({ncols}, 1fr);">']
+    # Preloads must live in this frame, where the <img> elements load
+    preloads = {}
+    for idx, movie in enumerate(movies):
+        prepared = _prepare_tile(movie, f"grid_{idx}", tldr_map=tldr_map, ncols=ncols)
+        if prepared is None:
+            continue
+        fields, tile_key, tile_state = prepared
+        # Position among rendered tiles; skipped movies do not take a slot
+        above = len(parts) - 2 < above_fold
+        # The inline fallback needs no fetch, so data: URIs are not preloaded
+        if above and not fields['image_url'].startswith('data:'):
+            preloads.setdefault(fields['image_url'], fields['poster_srcset'])
+        parts.append(_render_tile_html(
+            fields, tile_key, tile_state, lazy_load and not above, is_dark, above
+        ))
+
+    tile_count = len(parts) - 2
+    if not tile_count:
+        return
+    parts.append('</div>')
+    parts.append(_TILE_JS)
+    # Ahead of the grid markup so the fetches start before the tiles are parsed
+    parts.insert(1, "".join(_preload_link(url, srcset) for url, srcset in preloads.items()))
+
+    components.html(
+        "".join(parts),
+        height=_grid_height(-(-tile_count // ncols), ncols, frame_width, row_height),
+        scrolling=True
+    )
+
+def _grid_height(rows: int, ncols: int, frame_width: int, row_height: Optional[int] = None) -> int:
+    """Pixel height of a tile grid: ``rows`` rows plus the gaps between them."""
+    if row_height is None:
+        tile_width = (frame_width - (ncols - 1) * _GRID_GAP) / ncols
+        row_height = tile_width * 3 / 2 + _TILE_META_HEIGHT
+    return math.ceil(rows * row_height + (rows - 1) * _GRID_GAP)
 
 # Example usage and message handling
 if __name__ == "__main__":
     st.set_page_config(layout="wide")
     st.title("🎬 Enhanced MovieTile Component with Navigation")
     
-    # Message handling
-    components.html(
-        """
-        <script>
-        window.addEventListener("message", (event) => {
-            if (event.data.type === "streamlit:setComponentValue") {
-                // Forward to Streamlit
-                window.parent.postMessage(event.data, "*");
-            }
-        });
-        </script>
-        """,
-        height=0
-    )
-    
     # Handle component messages
     if "_component_value" in st.session_state:
         try:
             action = json.loads(st.session_state["_component_value"])
             
-            if action.get("type") == "navigation" and action.get("action") == "navigate_to_movie_details":
-                # Use the navigation function to navigate to movie details
-                navigate_to_movie_details(action["movie_id"], action.get("movie_title", ""))
-                
-                # Log analytics event
-                analytics_client.log_event(
-                    "poster_click",
-                    category="navigation",
-                    movie_id=action["movie_id"],
-                    movie_title=action.get("movie_title", ""),
-                    component="MovieTile"
-                )
-                
-            elif action.get("type") == "analytics":
+            if action.get("type") == "analytics":
                 # Log analytics event
                 analytics_client.log_event(
                     action["action"],
@@ -741,8 +1086,11 @@ if __name__ == "__main__":
                 )
                 
             elif action.get("type") == "movieTileAction":
-                prev_state = st.session_state.get(action["key"], False)
-                st.session_state[action["key"]] = action["state"]
+                tile_state = st.session_state.setdefault('_tile_state', {}).setdefault(
+                    action["tile_id"], {'liked': False, 'watchlisted': False}
+                )
+                tile_state['liked' if action["action"] == "like" else 'watchlisted'] = action["state"]
+                _prune_stale_keys()
                 
                 # Determine the action type for toast
                 if action["action"] == "like":
@@ -805,9 +1153,5 @@ if __name__ == "__main__":
         }
     ]
     
-    # Display tiles in responsive grid
-    cols = st.columns(2)
-    for idx, movie in enumerate(test_movies):
-        with cols[idx % len(cols)]:
-            # Pass the tldr data directly from the movie dictionary
-            MovieTile(movie, testid_suffix=f"col{idx}", tldr_data=movie.get("tldr"))
\ No newline at end of file
+    # Display tiles as one batched grid (TL;DR data is read from each movie)
+    MovieTileGrid(test_movies, ncols=2)
\ No newline at end of file
@@ -35,6 +35,10 @@ USER_PREFS_LOG_FORMAT = (
 TMDB_IMAGE_BASE_URL = "https://image.tmdb.org/t/p/w500"
 TMDB_POSTER_PLACEHOLDER = "/placeholder_poster.jpg"
 
+# Local image fallbacks (relative to the app root, as passed to st.image)
+POSTER_FALLBACK_IMAGE = "media_assets/icons/image-fallback.svg"
+PERSON_PLACEHOLDER_IMAGE = "media_assets/icons/person_placeholder.png"
+
 @dataclass
 class Genre:
     id: int
@@ -8,7 +8,7 @@ from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 from service_clients.tmdb_client import tmdb_client
 from ui_components import CastList, RecommendationCard
-from ui_components.RecommendationCard import RecommendationDisplayConfig
+from ui_components.RecommendationCard import RecommendationDisplayConfig, inject_card_css
 from session_utils.watchlist_manager import (
     load_watchlist,
     add_to_watchlist,
@@ -23,7 +23,8 @@ from session_utils.state_tracker import (
 from core_config.constants import (
     TMDB_IMAGE_BASE_URL,
     GENRES_FILE,
-    MOODS_FILE
+    MOODS_FILE,
+    PERSON_PLACEHOLDER_IMAGE
 )
 from streamlit.components.v1 import html
 from ai_smart_recommender.recommender_engine.strategy_interfaces.hybrid_model import recommender as hybrid_recommender
@@ -359,6 +360,9 @@ def render_recommendations(movie_id: int):
             # Create columns based on recommendation count (max 4)
             rec_count = min(len(recommendations), 4)
             cols = st.columns(rec_count, gap="medium")
+
+            # One shared stylesheet for all the cards below
+            inject_card_css()
             
             for idx, rec in enumerate(recommendations[:rec_count]):
                 with cols[idx]:
@@ -415,7 +419,7 @@ def render_cast_list(cast: List[Dict]):
                 profile_url = (
                     f"https://image.tmdb.org/t/p/w185{person.profile_path}"
                     if person.profile_path
-                    else "media_assets/icons/person_placeholder.png"
+                    else PERSON_PLACEHOLDER_IMAGE
                 )
                 st.image(
                     profile_url,
@@ -1,8 +1,9 @@
 import streamlit as st
 from service_clients.tmdb_client import tmdb_client
 from session_utils.state_tracker import init_session_state
-from app_ui.components.MovieTile import MovieTile
+from app_ui.components.MovieTile import MovieTileGrid
 from ui_components.CastList import CastList
+from core_config.constants import PERSON_PLACEHOLDER_IMAGE
 import media_assets.styles.main as styles
 from datetime import datetime
 
@@ -17,7 +18,7 @@ def show_actor_header(actor):
             profile_url = (
                 f"https://image.tmdb.org/t/p/original{actor.profile_path}" 
                 if actor.profile_path 
-                else "media_assets/icons/person_placeholder.png"
+                else PERSON_PLACEHOLDER_IMAGE
             )
             st.image(
                 profile_url,
@@ -65,16 +66,8 @@ def show_filmography(actor_id):
             show_movie_grid(credits)
 
 def show_movie_grid(movies):
-    """Display movie grid using your existing MovieTile component"""
-    cols = st.columns(4)
-    for idx, movie in enumerate(movies[:12]):  # Limit to 12 for mobile
-        with cols[idx % 4]:
-            MovieTile(
-                movie_data=movie,
-                show_details=True,
-                testid_suffix=f"filmography_{movie.id}",
-                lazy_load=True
-            )
+    """Display the filmography as one batched MovieTileGrid"""
+    MovieTileGrid(movies[:12], ncols=4, lazy_load=True)  # Limit to 12 for mobile
 
 def main():
     # Load all necessary styles from main styles module
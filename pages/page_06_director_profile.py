@@ -16,6 +16,7 @@ from ui_components.MovieGridView import MovieGridView as render_movie_grid
 from ui_components.Navigation import back_button
 from ui_components.HeaderBar import render_app_header
 from media_assets.styles.main import initialize_theme
+from core_config.constants import PERSON_PLACEHOLDER_IMAGE
 
 def director_profile_page():
     """Main director profile page with detailed filmography"""
@@ -76,7 +77,7 @@ def _render_director_sidebar(director: Dict) -> None:
     img_url = (
         f"https://image.tmdb.org/t/p/w300{profile_path}" 
         if profile_path 
-        else "media_assets/icons/person_placeholder.png"
+        else PERSON_PLACEHOLDER_IMAGE
     )
     st.image(img_url, use_column_width=True)
     
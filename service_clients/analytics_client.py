@@ -77,6 +77,9 @@ class AnalyticsClient:
         try:
             self._check_file_size()
             valid_events = [e for e in events if self._validate_event(e)]
+            session_id = self._get_session_id()
+            for event in valid_events:
+                event.setdefault("session_id", session_id)
             with open(self.analytics_file, "a") as f:
                 for event in valid_events:
                     f.write(json.dumps(event) + "\n")
@@ -35,6 +35,8 @@ LOG_BACKUP_COUNT = 5
 DEFAULT_TIMEOUT = 10
 MEMORY_CACHE_SIZE = 1000
 MEMORY_CACHE_TTL = 3600  # 1 hour
+HTTP_POOL_CONNECTIONS = 16  # Host pools cached; server-side only the API host is fetched
+HTTP_POOL_MAXSIZE = 32  # Reusable keep-alive connections to the API host
 
 # Data model classes
 class Genre:
@@ -149,6 +151,15 @@ class TMDBClient:
             self.base_url = "https://api.themoviedb.org/3"
             self.session = requests.Session()
             
+            # Pooled keep-alive adapter so concurrent Streamlit sessions sharing
+            # this singleton reuse TCP+TLS connections instead of reconnecting
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=HTTP_POOL_CONNECTIONS,
+                pool_maxsize=HTTP_POOL_MAXSIZE
+            )
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
+            
             if self.api_version == 4:
                 self.session.headers.update({
                     "Authorization": f"Bearer {self.api_key}",
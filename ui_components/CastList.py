@@ -8,9 +8,10 @@ Features:
 - Character role display
 """
 
+import html
 import streamlit as st
 from typing import List
-from core_config.constants import Person
+from core_config.constants import Person, PERSON_PLACEHOLDER_IMAGE
 
 class CastList:
     @staticmethod
@@ -49,18 +50,19 @@ class CastList:
                     st.session_state["current_page"] = "page_05_actor_profile"
                     st.rerun()
                 
-                # Profile image with error handling
-                try:
+                # Profile image - raw <img> so the browser fetches and caches it by URL
+                if person.profile_path:
                     img_url = f"https://image.tmdb.org/t/p/w185{person.profile_path}"
-                    st.image(
-                        img_url,
-                        width=100,
-                        caption=person.name,
-                        use_column_width=True
+                    name = html.escape(person.name)
+                    st.markdown(
+                        f'<img src="{img_url}" alt="{name}" loading="lazy" decoding="async" '
+                        f'style="width: 100%; border-radius: 8px;">'
+                        f'<div style="text-align: center; font-size: 0.875rem; opacity: 0.6;">{name}</div>',
+                        unsafe_allow_html=True
                     )
-                except:
+                else:
                     st.image(
-                        "media_assets/icons/person_placeholder.png",
+                        PERSON_PLACEHOLDER_IMAGE,
                         width=100,
                         caption=person.name
                     )
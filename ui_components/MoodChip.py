@@ -176,9 +176,8 @@ def MoodChip(
 
     component_key = f"moodchip_{key if key else mood}"
     
-    # Initialize session state
-    if component_key not in st.session_state:
-        st.session_state[component_key] = default
+    # Initialize session state (single lookup, reused below)
+    is_selected = st.session_state.setdefault(component_key, default)
 
     # Inject CSS styles
     inject_css("mood_chips")
@@ -207,7 +206,7 @@ def MoodChip(
             with cols[1]:
                 clicked = st.checkbox(
                     mood,
-                    value=st.session_state[component_key],
+                    value=is_selected,
                     key=f"{component_key}_cb",
                     disabled=disabled,
                     label_visibility="visible"
@@ -221,9 +220,9 @@ def MoodChip(
                 f"""
                 <div class="tooltip-wrapper">
                     <div role="button" 
-                         aria-pressed={'true' if st.session_state[component_key] else 'false'}
+                         aria-pressed={'true' if is_selected else 'false'}
                          aria-label="{mood} mood filter"
-                         class="mood-chip {'selected' if st.session_state[component_key] else ''} {'disabled' if disabled else ''}"
+                         class="mood-chip {'selected' if is_selected else ''} {'disabled' if disabled else ''}"
                          onclick="this.nextElementSibling.click()">
                         <span class="mood-emoji">{config['emoji']}</span>
                         {display_text}
@@ -243,10 +242,10 @@ def MoodChip(
 
     # Update state if clicked
     if clicked and not disabled:
-        st.session_state[component_key] = not st.session_state[component_key]
+        is_selected = st.session_state[component_key] = not is_selected
         st.rerun()
     
-    return st.session_state[component_key]
+    return is_selected
 @validate_moods
 def MoodSelector(
     moods: Optional[List[str]] = None,
@@ -262,10 +261,7 @@ def MoodSelector(
     
     # Initialize selection tracking
     selection_key = f"{key}_selections"
-    if selection_key not in st.session_state:
-        st.session_state[selection_key] = []
-    
-    current_selections = st.session_state[selection_key]
+    current_selections = st.session_state.setdefault(selection_key, [])
     
     # Create grid layout
     container = st.sidebar if in_sidebar else st
@@ -2,7 +2,7 @@ import streamlit as st
 from typing import List, Optional, Dict, Union
 from session_utils.state_tracker import get_user_prefs
 from core_config.constants import Movie
-from app_ui.components.MovieTile import MovieTile
+from app_ui.components.MovieTile import MovieTileGrid
 
 # Constants
 INITIAL_LOAD_COUNT = 12
@@ -61,62 +61,17 @@ class MovieGridView:
 
         movies_to_display = movies_data[:display_count]
 
-        # Grid container with optimized spacing
-        with st.container():
-            # CSS for tight grid layout with consistent metadata height
-            st.markdown(f"""
-            <style>
-                [data-testid="column"] {{
-                    padding: 0.25rem !important;
-                }}
-                [data-testid="stHorizontalBlock"] {{
-                    gap: 0.5rem !important;
-                }}
-                
-                /* Ensure consistent height for all movie tiles */
-                .movie-tile-container {{
-                    height: 100%;
-                    display: flex;
-                    flex-direction: column;
-                }}
-                
-                /* Fixed height for poster container */
-                .movie-poster-container {{
-                    flex: 0 0 auto;
-                }}
-                
-                /* Metadata section with consistent spacing */
-                .movie-metadata-section {{
-                    flex: 1 1 auto;
-                    min-height: 120px;
-                    display: flex;
-                    flex-direction: column;
-                    justify-content: space-between;
-                    padding: 8px 4px 0;
-                }}
-                
-                /* Genre tags container with fixed max height */
-                .movie-genres-container {{
-                    min-height: 32px;
-                    margin-top: 8px;
-                }}
-            </style>
-            """, unsafe_allow_html=True)
+        # Resolve the theme once for the whole grid instead of once per tile
+        is_dark = st.get_option("theme.base") == "dark"
 
-            # Create columns with minimal gap
-            cols = st.columns(grid_columns, gap="small")
-
-            # Render movies
-            for idx, movie in enumerate(movies_to_display):
-                with cols[idx % grid_columns]:
-                    # Wrap in container for consistent height
-                    st.markdown('<div class="movie-tile-container">', unsafe_allow_html=True)
-                    MovieTile(
-                        movie,
-                        testid_suffix=f"grid_{idx}",
-                        lazy_load=lazy_load
-                    )
-                    st.markdown('</div>', unsafe_allow_html=True)
+        # Render every tile in one batched component (CSS grid, single iframe);
+        # it preloads the above-the-fold posters inside that iframe
+        MovieTileGrid(
+            movies_to_display,
+            ncols=grid_columns,
+            lazy_load=lazy_load,
+            is_dark=is_dark
+        )
 
         # Pagination controls
         if lazy_load and show_pagination and len(movies_data) > display_count:
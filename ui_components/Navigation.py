@@ -2,6 +2,8 @@
 import streamlit as st
 from typing import Optional, Dict, Any
 from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType, SimpleNamespace
 import logging
 
 # Set up logging
@@ -9,13 +11,27 @@ logger = logging.getLogger(__name__)
 
 # Import the analytics client (make sure this exists from Task 1)
 try:
-    from service_clients.analytics_client import AnalyticsClient
+    from service_clients.analytics_client import analytics_client
 except ImportError:
-    # Fallback if analytics client is not available
-    class AnalyticsClient:
-        @staticmethod
-        def log_event(event_type, **kwargs):
-            logger.warning(f"Analytics event (fallback): {event_type} - {kwargs}")
+    # Fallback if analytics client is not available: log events instead
+    def _log_event_fallback(event_type, **kwargs):
+        logger.warning("Analytics event (fallback): %s - %s", event_type, kwargs)
+
+    def _log_events_fallback(events):
+        for event in events:
+            logger.warning("Analytics event (fallback): %s", event)
+
+    analytics_client = SimpleNamespace(log_event=_log_event_fallback, log_events=_log_events_fallback)
+
+def _current_page() -> str:
+    """Page the user is navigating from, as tracked in session state."""
+    return st.session_state.get('current_page', 'unknown')
+
+# Default st.button styling for back buttons; callers' kwargs take precedence
+_BACK_BUTTON_DEFAULTS = MappingProxyType({
+    "type": "secondary",
+    "use_container_width": True,
+})
 
 def back_button(
     target_page: str,
@@ -37,33 +53,24 @@ def back_button(
     Example:
         back_button("Home", label="Go Back", use_container_width=True)
     """
-    default_kwargs = {
-        "type": "secondary",
-        "use_container_width": True,
-    }
-    
     # Merge default and user-provided kwargs
-    final_kwargs = {**default_kwargs, **button_kwargs}
+    final_kwargs = dict(_BACK_BUTTON_DEFAULTS)
+    final_kwargs.update(button_kwargs)
     
     if st.button(label, key=key, **final_kwargs):
-        try:
-            # Log navigation event
-            AnalyticsClient.log_event(
-                event_type="navigation",
-                navigation_type="back_button",
-                source_page=st.session_state.get('current_page', 'unknown'),
-                target_page=target_page,
-                timestamp=datetime.now().isoformat(),
-                success=True
-            )
-        except Exception as e:
-            logger.error(f"Error logging navigation: {e}")
-            st.error(f"Error logging navigation: {e}")
+        # Log navigation event (the client handles its own failures)
+        analytics_client.log_event(
+            event_type="navigation",
+            navigation_type="back_button",
+            source_page=_current_page(),
+            target_page=target_page,
+            success=True
+        )
         
         if use_session_state:
             st.session_state.current_page = target_page
         else:
-            st.experimental_set_query_params(page=target_page)
+            st.query_params["page"] = target_page
         
         # Force a rerun to trigger the page change
         st.rerun()
@@ -84,26 +91,22 @@ def navigate_to_page(
         **button_kwargs: Additional button styling arguments
     """
     if st.button(button_label, **button_kwargs):
-        try:
-            # Log navigation event
-            AnalyticsClient.log_event(
-                event_type="navigation",
-                navigation_type="button_click",
-                source_page=st.session_state.get('current_page', 'unknown'),
-                target_page=page_name,
-                timestamp=datetime.now().isoformat(),
-                success=True
-            )
-        except Exception as e:
-            logger.error(f"Error logging navigation: {e}")
-            st.error(f"Error logging navigation: {e}")
+        # Log navigation event (the client handles its own failures)
+        analytics_client.log_event(
+            event_type="navigation",
+            navigation_type="button_click",
+            source_page=_current_page(),
+            target_page=page_name,
+            success=True
+        )
         
         if use_session_state:
             st.session_state.current_page = page_name
-            st.rerun()
         else:
-            st.experimental_set_query_params(page=page_name)
-            st.rerun()
+            st.query_params["page"] = page_name
+        
+        # Writing query params does not rerun the script by itself
+        st.rerun()
 
 def navigate_to_movie_details(movie_id: int, movie_title: str = "", source: str = "unknown"):
     """
@@ -114,35 +117,25 @@ def navigate_to_movie_details(movie_id: int, movie_title: str = "", source: str
         movie_title (str): Movie title for logging purposes
         source (str): Source of the navigation (e.g., "poster_click", "button")
     """
+    # One timestamp and one set of shared fields for the whole navigation;
+    # attempt and outcome are written together in one batch
+    base = dict(
+        navigation_type="movie_details",
+        source_page=_current_page(),
+        target_page="Movie Details",
+        movie_id=movie_id,
+        movie_title=movie_title,
+        source=source,
+        timestamp=datetime.now().isoformat(),
+    )
+    events = [dict(base, event_type="navigation_attempt", success=False)]
     try:
-        # Log navigation attempt
-        AnalyticsClient.log_event(
-            event_type="navigation_attempt",
-            navigation_type="movie_details",
-            source_page=st.session_state.get('current_page', 'unknown'),
-            target_page="Movie Details",
-            movie_id=movie_id,
-            movie_title=movie_title,
-            source=source,
-            timestamp=datetime.now().isoformat(),
-            success=False  # Will be updated if successful
-        )
-        
         # Set query parameters for movie details page
         st.query_params.update({"movie_id": movie_id})
         
         # Log successful navigation
-        AnalyticsClient.log_event(
-            event_type="navigation",
-            navigation_type="movie_details",
-            source_page=st.session_state.get('current_page', 'unknown'),
-            target_page="Movie Details",
-            movie_id=movie_id,
-            movie_title=movie_title,
-            source=source,
-            timestamp=datetime.now().isoformat(),
-            success=True
-        )
+        events.append(dict(base, event_type="navigation", success=True))
+        analytics_client.log_events(events)
         
         st.rerun()
         
@@ -151,21 +144,8 @@ def navigate_to_movie_details(movie_id: int, movie_title: str = "", source: str
         logger.error(error_msg)
         
         # Log navigation failure
-        try:
-            AnalyticsClient.log_event(
-                event_type="navigation_error",
-                navigation_type="movie_details",
-                source_page=st.session_state.get('current_page', 'unknown'),
-                target_page="Movie Details",
-                movie_id=movie_id,
-                movie_title=movie_title,
-                source=source,
-                error=str(e),
-                timestamp=datetime.now().isoformat(),
-                success=False
-            )
-        except Exception as log_error:
-            logger.error(f"Failed to log navigation error: {log_error}")
+        events.append(dict(base, event_type="navigation_error", error=str(e), success=False))
+        analytics_client.log_events(events)
         
         # Fallback: Show error message and provide alternative navigation
         st.error(error_msg)
@@ -179,8 +159,12 @@ def fallback_navigation(movie_id: int, movie_title: str = ""):
         movie_id (int): The TMDB movie ID
         movie_title (str): Movie title for display
     """
-    st.markdown(
-        f"""
+    st.markdown(_fallback_navigation_html(movie_id, movie_title), unsafe_allow_html=True)
+
+@lru_cache(maxsize=512)
+def _fallback_navigation_html(movie_id: int, movie_title: str) -> str:
+    """Fallback navigation markup; cached since the same movies recur across reruns."""
+    return f"""
         <div style="padding: 1rem; background-color: #f8f9fa; border-radius: 8px; margin: 1rem 0;">
             <h4>Navigation Issue</h4>
             <p>Could not navigate automatically. Click the button below to view details for:</p>
@@ -191,10 +175,9 @@ def fallback_navigation(movie_id: int, movie_title: str = ""):
                 </button>
             </a>
         </div>
-        """,
-        unsafe_allow_html=True
-    )
+        """
 
+@lru_cache(maxsize=512)
 def create_movie_poster_fallback(movie_id: int, poster_url: str, movie_title: str, width: int = 200):
     """
     Creates an HTML clickable poster fallback for when Streamlit navigation fails.
@@ -217,45 +200,51 @@ def create_movie_poster_fallback(movie_id: int, poster_url: str, movie_title: st
     </a>
     """
 
+# Shared back-button and fallback-navigation styles
+_BACK_BUTTON_CSS = """
+<style>
+/* Consistent back button styling */
+div.stButton > button:first-child {
+    border-radius: 8px;
+    transition: all 0.3s ease;
+}
+div.stButton > button:first-child:hover {
+    transform: translateX(-3px);
+}
+
+/* Style for fallback navigation button */
+.fallback-nav {
+    background-color: #f8f9fa;
+    padding: 1rem;
+    border-radius: 8px;
+    margin: 1rem 0;
+    border: 1px solid #dee2e6;
+}
+
+.fallback-nav button {
+    background-color: #007bff;
+    color: white;
+    padding: 0.5rem 1rem;
+    border: none;
+    border-radius: 4px;
+    cursor: pointer;
+}
+
+.fallback-nav button:hover {
+    background-color: #0056b3;
+}
+</style>
+"""
+
+@st.cache_resource(show_spinner=False)
+def _inject_back_button_css():
+    st.markdown(_BACK_BUTTON_CSS, unsafe_allow_html=True)
+    return True
+
 def back_button_style():
     """
     Applies consistent CSS styling for back buttons across the app.
-    Called once in your main app configuration.
+    Called once in your main app configuration. The stylesheet is built once
+    per process; reruns replay the cached element.
     """
-    st.markdown(
-        """
-        <style>
-        /* Consistent back button styling */
-        div.stButton > button:first-child {
-            border-radius: 8px;
-            transition: all 0.3s ease;
-        }
-        div.stButton > button:first-child:hover {
-            transform: translateX(-3px);
-        }
-        
-        /* Style for fallback navigation button */
-        .fallback-nav {
-            background-color: #f8f9fa;
-            padding: 1rem;
-            border-radius: 8px;
-            margin: 1rem 0;
-            border: 1px solid #dee2e6;
-        }
-        
-        .fallback-nav button {
-            background-color: #007bff;
-            color: white;
-            padding: 0.5rem 1rem;
-            border: none;
-            border-radius: 4px;
-            cursor: pointer;
-        }
-        
-        .fallback-nav button:hover {
-            background-color: #0056b3;
-        }
-        </style>
-        """,
-        unsafe_allow_html=True
-    )
\ No newline at end of file
+    _inject_back_button_css()
@@ -1,5 +1,139 @@
 import streamlit as st
 import time
+from functools import lru_cache
+from html import escape
+
+# TL;DR summaries longer than this are cut to fit, ending in a single ellipsis
+_SUMMARY_MAX = 120
+
+# Stylesheet for the summary card and its shimmer placeholder
+_QS_CSS = """
+<style>
+.quick-summary {
+    border-left: 4px solid var(--secondary-color);
+    padding: 0.5rem 1rem;
+    margin: 1rem 0;
+    background-color: var(--background-color-secondary);
+    border-radius: 0 8px 8px 0;
+}
+.summary-text {
+    font-size: 1.1rem;
+    font-weight: 500;
+    margin-bottom: 0.75rem;
+    color: var(--text-color);
+}
+.theme-pill {
+    display: inline-block;
+    padding: 0.25rem 0.75rem;
+    margin: 0.25rem;
+    border-radius: 16px;
+    background-color: var(--background-color);
+    color: var(--text-color);
+    font-size: 0.85rem;
+    box-shadow: 0 1px 3px rgba(0,0,0,0.1);
+    transition: all 0.2s ease;
+    cursor: pointer;
+}
+.theme-pill:hover {
+    transform: translateY(-2px);
+    box-shadow: 0 3px 6px rgba(0,0,0,0.15);
+}
+.content-flag {
+    display: inline-flex;
+    align-items: center;
+    padding: 0.35rem 0.75rem;
+    margin: 0.25rem;
+    border-radius: 6px;
+    background-color: color-mix(in srgb, var(--secondary-color) 10%, transparent);
+    color: var(--secondary-color);
+    font-size: 0.85rem;
+    border: 1px solid color-mix(in srgb, var(--secondary-color) 20%, transparent);
+}
+.section-label {
+    font-size: 0.9rem;
+    font-weight: 600;
+    color: color-mix(in srgb, var(--text-color) 60%, transparent);
+    margin: 0.5rem 0 0.25rem 0;
+}
+
+/* Shimmer loading animation */
+@keyframes shimmer {
+    0% { background-position: -468px 0 }
+    100% { background-position: 468px 0 }
+}
+.shimmer {
+    color: transparent;
+    animation-duration: 1.5s;
+    animation-fill-mode: forwards;
+    animation-iteration-count: infinite;
+    animation-name: shimmer;
+    animation-timing-function: linear;
+    background: var(--background-color);
+    background: linear-gradient(to right, var(--background-color) 8%, color-mix(in srgb, var(--background-color) 90%, var(--text-color)) 18%, var(--background-color) 33%);
+    background-size: 800px 104px;
+    position: relative;
+}
+.shimmer-block {
+    height: 1rem;
+    margin-bottom: 0.5rem;
+    border-radius: 4px;
+}
+.shimmer-pill {
+    display: inline-block;
+    height: 1.75rem;
+    width: 5rem;
+    margin: 0.25rem;
+    border-radius: 16px;
+}
+</style>
+"""
+
+# Static placeholder shown while the TL;DR is being generated
+_SHIMMER_HTML = """
+<div class="quick-summary">
+    <div class="shimmer shimmer-block" style="width: 100%; height: 1.5rem; margin-bottom: 1rem;"></div>
+    <div class="section-label">Themes</div>
+    <div>
+        <span class="shimmer shimmer-pill"></span>
+        <span class="shimmer shimmer-pill"></span>
+        <span class="shimmer shimmer-pill"></span>
+    </div>
+    <div class="section-label" style="margin-top: 0.75rem;">Content Notes</div>
+    <div>
+        <span class="shimmer shimmer-pill" style="width: 7rem;"></span>
+        <span class="shimmer shimmer-pill" style="width: 8rem;"></span>
+    </div>
+</div>
+"""
+
+# Per-item tags; values are HTML-escaped before formatting. The theme is passed
+# to the click handler via a data attribute so it never lands inside JS source.
+_THEME_PILL = '<span class="theme-pill" data-theme="{t}" onclick="handleThemeClick(this.dataset.theme)">{t}</span>'
+_FLAG_TAG = '<span class="content-flag">{f}</span>'
+
+# Theme and flag vocabularies repeat across summaries, so escapes are memoised
+_esc = lru_cache(maxsize=1024)(escape)
+
+# Theme pill click handler, shipped with the stylesheet
+_QS_SCRIPT = """
+<script>
+function handleThemeClick(theme) {
+    // This would typically be handled by Streamlit components
+    // For now, we'll just log to console
+    console.log("Theme clicked: " + theme);
+    // In a real implementation, you might want to:
+    // 1. Set a session state value
+    // 2. Trigger a callback
+    // 3. Navigate to a filtered view
+}
+</script>
+"""
+
+@st.cache_resource(show_spinner=False)
+def _inject_quick_summary_css():
+    """Emit the summary stylesheet and script; cached so reruns replay them instead of rebuilding them."""
+    st.markdown(_QS_CSS + _QS_SCRIPT, unsafe_allow_html=True)
+    return True
 
 def render_quick_summary(summary_data):
     """
@@ -13,6 +147,7 @@ def render_quick_summary(summary_data):
     """
     if summary_data is None:
         # Show shimmer loading state
+        _inject_quick_summary_css()
         _render_shimmer_loading()
         return
     
@@ -20,151 +155,38 @@ def render_quick_summary(summary_data):
         st.info("No summary data available.")
         return
     
+    _inject_quick_summary_css()
+    
     # Container with subtle border
     with st.container():
-        st.markdown("""
-        <style>
-        .quick-summary {
-            border-left: 4px solid var(--secondary-color);
-            padding: 0.5rem 1rem;
-            margin: 1rem 0;
-            background-color: var(--background-color-secondary);
-            border-radius: 0 8px 8px 0;
-        }
-        .summary-text {
-            font-size: 1.1rem;
-            font-weight: 500;
-            margin-bottom: 0.75rem;
-            color: var(--text-color);
-        }
-        .theme-pill {
-            display: inline-block;
-            padding: 0.25rem 0.75rem;
-            margin: 0.25rem;
-            border-radius: 16px;
-            background-color: var(--background-color);
-            color: var(--text-color);
-            font-size: 0.85rem;
-            box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-            transition: all 0.2s ease;
-            cursor: pointer;
-        }
-        .theme-pill:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 3px 6px rgba(0,0,0,0.15);
-        }
-        .content-flag {
-            display: inline-flex;
-            align-items: center;
-            padding: 0.35rem 0.75rem;
-            margin: 0.25rem;
-            border-radius: 6px;
-            background-color: color-mix(in srgb, var(--secondary-color) 10%, transparent);
-            color: var(--secondary-color);
-            font-size: 0.85rem;
-            border: 1px solid color-mix(in srgb, var(--secondary-color) 20%, transparent);
-        }
-        .section-label {
-            font-size: 0.9rem;
-            font-weight: 600;
-            color: color-mix(in srgb, var(--text-color) 60%, transparent);
-            margin: 0.5rem 0 0.25rem 0;
-        }
-        
-        /* Shimmer loading animation */
-        @keyframes shimmer {
-            0% { background-position: -468px 0 }
-            100% { background-position: 468px 0 }
-        }
-        .shimmer {
-            color: transparent;
-            animation-duration: 1.5s;
-            animation-fill-mode: forwards;
-            animation-iteration-count: infinite;
-            animation-name: shimmer;
-            animation-timing-function: linear;
-            background: var(--background-color);
-            background: linear-gradient(to right, var(--background-color) 8%, color-mix(in srgb, var(--background-color) 90%, var(--text-color)) 18%, var(--background-color) 33%);
-            background-size: 800px 104px;
-            position: relative;
-        }
-        .shimmer-block {
-            height: 1rem;
-            margin-bottom: 0.5rem;
-            border-radius: 4px;
-        }
-        .shimmer-pill {
-            display: inline-block;
-            height: 1.75rem;
-            width: 5rem;
-            margin: 0.25rem;
-            border-radius: 16px;
-        }
-        </style>
-        """, unsafe_allow_html=True)
-        
         # Process summary text (truncate if needed)
         summary = summary_data.get('summary', 'No summary available')
-        if len(summary) > 120:
-            summary = summary[:117] + "..."
+        if len(summary) > _SUMMARY_MAX:
+            summary = summary[:_SUMMARY_MAX - 1] + "…"
         
-        # Summary section
-        st.markdown(f"""
-        <div class="quick-summary">
-            <div class="summary-text">✨ {summary}</div>
-        """, unsafe_allow_html=True)
+        # Summary section; the whole card is assembled and sent as one element
+        parts = [f'<div class="quick-summary"><div class="summary-text">✨ {escape(summary)}</div>']
         
         # Themes section
-        themes = summary_data.get('themes', [])
+        themes = summary_data.get('themes') or ()
         if themes:
-            st.markdown('<div class="section-label">Themes</div>', unsafe_allow_html=True)
-            themes_html = ''.join([f'<span class="theme-pill" onclick="handleThemeClick(\'{theme}\')">{theme}</span>' for theme in themes])
-            st.markdown(themes_html, unsafe_allow_html=True)
+            parts.append('<div class="section-label">Themes</div><div>')
+            parts.append(''.join(_THEME_PILL.format(t=_esc(str(theme))) for theme in themes))
+            parts.append('</div>')
         
         # Content flags section (using the more descriptive key name)
-        content_flags = summary_data.get('content_flags', [])
+        content_flags = summary_data.get('content_flags') or ()
         if content_flags:
-            st.markdown('<div class="section-label" style="margin-top: 0.75rem;">Content Notes</div>', unsafe_allow_html=True)
-            flags_html = ''.join([f'<span class="content-flag">{flag}</span>' for flag in content_flags])
-            st.markdown(flags_html, unsafe_allow_html=True)
-        
-        st.markdown('</div>', unsafe_allow_html=True)
+            parts.append('<div class="section-label" style="margin-top: 0.75rem;">Content Notes</div><div>')
+            parts.append(''.join(_FLAG_TAG.format(f=_esc(str(flag))) for flag in content_flags))
+            parts.append('</div>')
         
-        # Add JavaScript for theme pill clicks
-        st.markdown("""
-        <script>
-        function handleThemeClick(theme) {
-            // This would typically be handled by Streamlit components
-            // For now, we'll just log to console
-            console.log("Theme clicked: " + theme);
-            
-            // In a real implementation, you might want to:
-            // 1. Set a session state value
-            // 2. Trigger a callback
-            // 3. Navigate to a filtered view
-        }
-        </script>
-        """, unsafe_allow_html=True)
+        parts.append('</div>')
+        st.markdown(''.join(parts), unsafe_allow_html=True)
 
 def _render_shimmer_loading():
     """Render a shimmer loading effect while content is being fetched"""
-    with st.container():
-        st.markdown("""
-        <div class="quick-summary">
-            <div class="shimmer shimmer-block" style="width: 100%; height: 1.5rem; margin-bottom: 1rem;"></div>
-            <div class="section-label">Themes</div>
-            <div>
-                <span class="shimmer shimmer-pill"></span>
-                <span class="shimmer shimmer-pill"></span>
-                <span class="shimmer shimmer-pill"></span>
-            </div>
-            <div class="section-label" style="margin-top: 0.75rem;">Content Notes</div>
-            <div>
-                <span class="shimmer shimmer-pill" style="width: 7rem;"></span>
-                <span class="shimmer shimmer-pill" style="width: 8rem;"></span>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+    st.markdown(_SHIMMER_HTML, unsafe_allow_html=True)
 
 # Backward compatibility function
 def render_quick_summary_with_flags(summary_data):
@@ -172,8 +194,8 @@ def render_quick_summary_with_flags(summary_data):
     Legacy support for components that still use 'flags' instead of 'content_flags'
     """
     if summary_data and 'flags' in summary_data and 'content_flags' not in summary_data:
-        summary_data = summary_data.copy()
-        summary_data['content_flags'] = summary_data.pop('flags')
+        # Rename the key in a single pass; the caller's dict is left untouched
+        summary_data = {('content_flags' if k == 'flags' else k): v for k, v in summary_data.items()}
     
     return render_quick_summary(summary_data)
 
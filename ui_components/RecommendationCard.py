@@ -10,12 +10,14 @@ Features:
 """
 
 import streamlit as st
+from functools import lru_cache
+from html import escape
 from typing import Union, Optional
 from dataclasses import dataclass
 
 from service_clients.tmdb_client import tmdb_client
 from session_utils.performance_monitor import log_performance
-from core_config.constants import Movie
+from core_config.constants import Movie, POSTER_FALLBACK_IMAGE
 from ai_smart_recommender.recommender_engine.strategy_interfaces.hybrid_model import MovieRecommendation
 
 # Critic mode styling presets
@@ -66,6 +68,51 @@ def _get_style_config():
 def _get_recommendation_style(match_type: Optional[str]):
     return REC_TYPE_STYLES.get(match_type, REC_TYPE_STYLES['popular'])
 
+@lru_cache(maxsize=8)
+def _card_css(border: str, bg: str, color: str) -> str:
+    """Card stylesheet for one critic style; per-card colours are CSS variables."""
+    return f"""
+    <style>
+        [class*="st-key-rec-card-"] {{
+            border: {border} !important;
+            border-radius: 8px !important;
+            background: {bg} !important;
+            padding: 12px !important;
+            margin-bottom: 16px !important;
+            position: relative !important;
+        }}
+        .rec-badge {{
+            position: absolute !important;
+            top: 8px !important;
+            right: 8px !important;
+            font-size: 1.2em !important;
+            color: var(--rec-color) !important;
+        }}
+        .rec-reason {{
+            font-size: 0.85rem !important;
+            color: {color} !important;
+            padding: 8px 0 !important;
+            border-top: 1px dashed {color} !important;
+            margin-top: 8px !important;
+        }}
+    </style>
+    """
+
+def inject_card_css():
+    """
+    Emit the shared recommendation card stylesheet.
+
+    Call once per page before rendering the cards, so the page gets one
+    <style> element however many cards it shows.
+    """
+    style = _get_style_config()
+    st.markdown(_card_css(style['border'], style['bg'], style['color']), unsafe_allow_html=True)
+
+@lru_cache(maxsize=4096)
+def _poster_url(poster_path: Optional[str], size: str = 'w154') -> Optional[str]:
+    # Pure function of its arguments, so safe to share across sessions and reruns
+    return tmdb_client._get_poster_url(poster_path, size) if poster_path else None
+
 def RecommendationCard(
     movie: Union[dict, Movie, MovieRecommendation],
     config: Optional[RecommendationDisplayConfig] = None
@@ -84,11 +131,21 @@ def RecommendationCard(
         vote_avg = getattr(movie, 'vote_average', movie.get('vote_average', 0))
         release_date = getattr(movie, 'release_date', movie.get('release_date'))
 
+        # Single pass over genres (Genre objects, dicts or strings), stopping
+        # at the two the card shows
+        raw_genres = movie.genres if hasattr(movie, 'genres') else movie.get('genres', [])
         genres = []
-        if hasattr(movie, 'genres'):
-            genres = [g.name if hasattr(g, 'name') else str(g) for g in movie.genres]
-        else:
-            genres = movie.get('genres', [])
+        for g in raw_genres or ():
+            if isinstance(g, dict):
+                name = g.get('name')
+            elif hasattr(g, 'name'):
+                name = g.name
+            else:
+                name = str(g) if g else None
+            if name:
+                genres.append(name)
+                if len(genres) == 2:
+                    break
 
     # Extract recommendation-specific data
     with timer.child("Rec Data Extraction"):
@@ -98,111 +155,91 @@ def RecommendationCard(
         similarity = getattr(movie, 'similarity_score', None)
         rec_style = _get_recommendation_style(match_type)
 
-    # CSS Injection
-    with timer.child("CSS Generation"):
-        st.markdown(f"""
-        <style>
-            .rec-card-{movie_id} {{
-                border: {style['border']} !important;
-                border-radius: 8px !important;
-                background: {style['bg']} !important;
-                padding: 12px !important;
-                margin-bottom: 16px !important;
-                position: relative !important;
-            }}
-            .rec-badge {{
-                position: absolute !important;
-                top: 8px !important;
-                right: 8px !important;
-                font-size: 1.2em !important;
-                color: {rec_style['color']} !important;
-            }}
-            .rec-reason {{
-                font-size: 0.85rem !important;
-                color: {style['color']} !important;
-                padding: 8px 0 !important;
-                border-top: 1px dashed {style['color']} !important;
-                margin-top: 8px !important;
-            }}
-        </style>
-        """, unsafe_allow_html=True)
-
     # Card layout
-    with st.container():
-        with st.container(border=True, className=f"rec-card-{movie_id}"):
-            if is_recommendation:
+    # The container key becomes an st-key-rec-card-* class the stylesheet targets
+    with st.container(border=True, key=f"rec-card-{movie_id}"):
+        if is_recommendation:
+            st.markdown(
+                f'<div class="rec-badge" style="--rec-color: {rec_style["color"]};" '
+                f'title="{match_type} recommendation">{rec_style["icon"]}</div>',
+                unsafe_allow_html=True
+            )
+
+        col1, col2 = st.columns([1, 3])
+        with col1:
+            poster_url = _poster_url(poster_path)
+            if poster_url:
+                # Raw <img> so the browser defers off-screen posters until scrolled to
                 st.markdown(
-                    f'<div class="rec-badge" title="{match_type} recommendation">'
-                    f'{rec_style["icon"]}</div>',
+                    f'<img src="{escape(poster_url)}" alt="{escape(str(title))}" width="120" '
+                    f'loading="lazy" decoding="async" style="width: 100%; height: auto;">',
                     unsafe_allow_html=True
                 )
-
-            col1, col2 = st.columns([1, 3])
-            with col1:
-                poster_url = tmdb_client._get_poster_url(poster_path, 'w154') if poster_path else None
+            else:
+                # The bundled fallback is a local file, served through st.image
                 st.image(
-                    poster_url or "media_assets/icons/image-fallback.svg",
+                    POSTER_FALLBACK_IMAGE,
                     width=120,
                     use_column_width=True
                 )
 
-            with col2:
+        with col2:
+            st.markdown(
+                f"<span style='color: {style['color']}; font-weight: bold;'>{title}</span>",
+                unsafe_allow_html=True
+            )
+
+            meta_cols = st.columns(3)
+            with meta_cols[0]:
+                if release_date:
+                    st.caption(f"📅 {release_date[:4]}")
+            with meta_cols[1]:
+                if genres:
+                    st.caption(f"🎭 {', '.join(genres)}")
+            with meta_cols[2]:
+                if vote_avg > 0:
+                    st.caption(f"⭐ {vote_avg:.1f}")
+
+            if similarity is not None:
+                st.progress(
+                    min(float(similarity), 1.0),
+                    text=f"Match: {similarity:.0%}"
+                )
+
+            if reason and config.show_explanation:
                 st.markdown(
-                    f"<span style='color: {style['color']}; font-weight: bold;'>{title}</span>",
+                    f'<div class="rec-reason">'
+                    f'{style["reason_icon"]} {reason}'
+                    f'</div>',
                     unsafe_allow_html=True
                 )
 
-                meta_cols = st.columns(3)
-                with meta_cols[0]:
-                    if release_date:
-                        st.caption(f"📅 {release_date[:4]}")
-                with meta_cols[1]:
-                    if genres:
-                        st.caption(f"🎭 {', '.join(genres[:2])}")
-                with meta_cols[2]:
-                    if vote_avg > 0:
-                        st.caption(f"⭐ {vote_avg:.1f}")
-
-                if similarity is not None:
-                    st.progress(
-                        min(float(similarity), 1.0),
-                        text=f"Match: {similarity:.0%}"
-                    )
-
-                if reason and config.show_explanation:
-                    st.markdown(
-                        f'<div class="rec-reason">'
-                        f'{style["reason_icon"]} {reason}'
-                        f'</div>',
-                        unsafe_allow_html=True
-                    )
-
-                btn_cols = st.columns([2, 1, 1])
-                with btn_cols[0]:
-                    if st.button(
-                        "View Details",
-                        key=f"view_{movie_id}",
-                        use_container_width=True
-                    ):
-                        st.session_state['selected_movie'] = movie_id
-                        st.rerun()
-
-                with btn_cols[1]:
-                    if st.button(
-                        "❤️ Save",
-                        key=f"save_{movie_id}",
-                        use_container_width=True
-                    ):
-                        st.session_state.setdefault('saved_movies', []).append(movie_id)
-                        st.toast(f"Saved {title}")
-
-                with btn_cols[2]:
-                    if st.button(
-                        "🚫 Hide",
-                        key=f"hide_{movie_id}",
-                        use_container_width=True
-                    ):
-                        st.session_state.setdefault('hidden_movies', []).append(movie_id)
-                        st.rerun()
+            btn_cols = st.columns([2, 1, 1])
+            with btn_cols[0]:
+                if st.button(
+                    "View Details",
+                    key=f"view_{movie_id}",
+                    use_container_width=True
+                ):
+                    st.session_state['selected_movie'] = movie_id
+                    st.rerun()
+
+            with btn_cols[1]:
+                if st.button(
+                    "❤️ Save",
+                    key=f"save_{movie_id}",
+                    use_container_width=True
+                ):
+                    st.session_state.setdefault('saved_movies', []).append(movie_id)
+                    st.toast(f"Saved {title}")
+
+            with btn_cols[2]:
+                if st.button(
+                    "🚫 Hide",
+                    key=f"hide_{movie_id}",
+                    use_container_width=True
+                ):
+                    st.session_state.setdefault('hidden_movies', []).append(movie_id)
+                    st.rerun()
 
     timer.stop()